@@ -5,12 +5,15 @@ to eliminate magic numbers and provide a single source of truth
 for PDF layout decisions.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from fpdf.enums import TextEmphasis
 
+# Inches per millimetre (1 inch = 25.4 mm)
+MM_TO_INCH = 1.0 / 25.4
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ReportLayout:
     """Immutable configuration for PDF report layout.
 
@@ -39,6 +42,22 @@ class ReportLayout:
     title_spacing_mm: float = 5
     small_section_spacing_mm: float = 2
 
+    # Derived in __post_init__; fixed for the lifetime of the layout
+    horizontal_margins_mm: float = field(init=False, repr=False, compare=False)
+    figure_x_mm: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute values derived from the margins and table width."""
+        # Frozen dataclass: bypass the generated __setattr__
+        object.__setattr__(
+            self, "horizontal_margins_mm", self.left_margin_mm + self.right_margin_mm
+        )
+        object.__setattr__(
+            self,
+            "figure_x_mm",
+            self.left_margin_mm + self.table_width_mm + self.table_gap_mm,
+        )
+
     def calculate_figure_width(self, page_width_mm: float) -> float:
         """Calculate optimal figure width based on available space.
 
@@ -49,7 +68,7 @@ class ReportLayout:
             Figure width in mm
 
         """
-        available_width = page_width_mm - self.left_margin_mm - self.right_margin_mm
+        available_width = page_width_mm - self.horizontal_margins_mm
 
         return max(
             self.figure_min_width_mm, min(self.figure_max_width_mm, available_width)
@@ -62,8 +81,7 @@ class ReportLayout:
             Tuple of (x_position_mm, y_position_mm)
 
         """
-        x_position = self.left_margin_mm + self.table_width_mm + self.table_gap_mm
-        return x_position, 0  # y_position will be set by caller
+        return self.figure_x_mm, 0  # y_position will be set by caller
 
 
 # Default layout instance
@@ -71,13 +89,22 @@ DEFAULT_LAYOUT = ReportLayout()
 
 
 # Figure sizing configuration
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FigureConfig:
     """Configuration for matplotlib figure generation."""
 
     size_inches: tuple[float, float] = (5.0, 5.0)  # Made taller (was 4.0)
     dpi: int = 300
 
+    # Height / width of size_inches, derived in __post_init__
+    aspect_ratio: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the aspect ratio of the configured figure size."""
+        object.__setattr__(
+            self, "aspect_ratio", self.size_inches[1] / self.size_inches[0]
+        )
+
     def calculate_size_for_width(self, target_width_mm: float) -> tuple[float, float]:
         """Calculate figure size to fit target width while maintaining aspect ratio.
 
@@ -88,12 +115,10 @@ class FigureConfig:
             Tuple of (width_inches, height_inches)
 
         """
-        # Convert mm to inches (1 inch = 25.4 mm)
-        target_width_inches = target_width_mm / 25.4
+        target_width_inches = target_width_mm * MM_TO_INCH
 
         # Maintain aspect ratio
-        aspect_ratio = self.size_inches[1] / self.size_inches[0]
-        height_inches = target_width_inches * aspect_ratio
+        height_inches = target_width_inches * self.aspect_ratio
 
         return target_width_inches, height_inches
 
@@ -107,7 +132,7 @@ COLOR_BLACK = (0, 0, 0)
 COLOR_GREY = (128, 128, 128)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReportStyleConfig:
     """Configuration for report visual styling.
 
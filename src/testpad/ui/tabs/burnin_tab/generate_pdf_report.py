@@ -5,15 +5,25 @@ from typing import TYPE_CHECKING, Any
 from fpdf import FPDF, Align, FontFace
 
 from testpad.config.defaults import DEFAULT_EXPORT_DIR, DEFAULT_FUS_LOGO_PATH
-from testpad.ui.tabs.burnin_tab.report_layout import (
+from testpad.config.report_layout import (
     DEFAULT_FIGURE_CONFIG,
-    DEFAULT_LAYOUT,
-    DEFAULT_STYLE_CONFIG,
+    ReportLayout,
+    ReportStyleConfig,
 )
 
 if TYPE_CHECKING:
     from testpad.core.burnin.burnin_stats import BurninStats
 
+# The Burnin report uses tighter margins and larger type than the defaults
+BURNIN_LAYOUT = ReportLayout(left_margin_mm=10, top_margin_mm=10, right_margin_mm=10)
+BURNIN_STYLE_CONFIG = ReportStyleConfig(
+    title_text_size=16,
+    subtitle_text_size=12,
+    metadata_text_size=10,
+    spec_text_size=10,
+    data_text_size=10,
+)
+
 
 class GenerateReport:
     """Generates a PDF report for the Burnin Tab."""
@@ -64,9 +74,9 @@ class GenerateReport:
         self.logo_path = logo_path
 
         # Layout configuration
-        self.layout = DEFAULT_LAYOUT
+        self.layout = BURNIN_LAYOUT
         self.figure_config = DEFAULT_FIGURE_CONFIG
-        self.styling_config = DEFAULT_STYLE_CONFIG
+        self.styling_config = BURNIN_STYLE_CONFIG
 
     def generate_report(self) -> None:
         """Generate and export the PDF report for the Burnin Tab."""
@@ -11,6 +11,9 @@ if TYPE_CHECKING:
 
 from testpad.ui.tabs.degasser_tab.plotting import plot_time_series_on_axis
 
+# (measurements, temperature_c) as drawn by TimeSeriesChartWidget
+_PlotInputs = tuple[tuple[tuple[int, float], ...], float | None]
+
 
 class TimeSeriesChartWidget(QWidget):
     """A QWidget that contains a Matplotlib time series plot."""
@@ -24,6 +27,9 @@ class TimeSeriesChartWidget(QWidget):
         self._ax = self._figure.add_subplot(111)
         self._canvas = FigureCanvas(self._figure)
 
+        # Inputs of the last drawn plot, used to skip redundant redraws
+        self._plotted: _PlotInputs | None = None
+
         # Timer for debouncing resize events
         self._resize_timer = QTimer()
         self._resize_timer.setSingleShot(True)
@@ -58,11 +64,19 @@ class TimeSeriesChartWidget(QWidget):
     ) -> None:
         """Update the matplotlib plot with new time series data.
 
+        Redrawing is skipped when the data matches what is already plotted,
+        e.g. when only a metadata field changed.
+
         Args:
             measurements: Sequence of (minute, oxygen_level) tuples.
             temperature_c: Optional temperature in Celsius to display in title.
 
         """
+        plotted = (tuple(measurements), temperature_c)
+        if plotted == self._plotted:
+            return
+        self._plotted = plotted
+
         # Clear the existing plot
         self._ax.clear()
 
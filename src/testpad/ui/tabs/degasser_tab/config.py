@@ -145,7 +145,11 @@ MAXIMUM_END_MINUTE = 20
 MINIMUM_END_MINUTE = 10
 TIME_SERIES_RESOLUTION_MINUTES = 1  # Measurement interval
 DEFAULT_TIME_SERIES_TEMP = DEFAULT_TEMPERATURE_C
+# Console Output
+CONSOLE_MAX_LINES = 2000  # Oldest lines are dropped beyond this
 
 
 # === Output File Configuration ===
 PDF_REPORT_NAME_PREFIX = "FUS DS-50 Test Report-"
+CSV_EXPORT_NAME_PREFIX = "degasser_data_"
+CSV_EXPORT_TIMESTAMP_FORMAT = "%y%m%d-%H%M%S"  # Appended to the CSV export name
@@ -1,7 +1,7 @@
 """Report generation for the Degasser Tab."""
 
-import contextlib
 import datetime
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +9,12 @@ from fpdf import FPDF, Align, FontFace
 from fpdf.table import Table
 
 from testpad.config.defaults import DEFAULT_EXPORT_DIR, DEFAULT_FUS_LOGO_PATH
+from testpad.config.report_layout import (
+    DEFAULT_FIGURE_CONFIG,
+    DEFAULT_LAYOUT,
+    DEFAULT_STYLE_CONFIG,
+    MM_TO_INCH,
+)
 from testpad.ui.tabs.degasser_tab.config import (
     DEFAULT_TEST_DESCRIPTIONS,
     DISSOLVED_OXYGEN_STRING,
@@ -26,12 +32,7 @@ from testpad.ui.tabs.degasser_tab.config import (
 )
 from testpad.ui.tabs.degasser_tab.plotting import (
     make_time_series_figure,
-    save_figure_to_temp_file,
-)
-from testpad.ui.tabs.degasser_tab.report_layout import (
-    DEFAULT_FIGURE_CONFIG,
-    DEFAULT_LAYOUT,
-    DEFAULT_STYLE_CONFIG,
+    render_figure_to_png,
 )
 
 
@@ -75,7 +76,8 @@ class GenerateReport:
         self.test_data = test_data
         self.time_series = time_series
         self.temperature = temperature
-        self.output_dir = output_dir
+        # Normalized once; callers may pass a str
+        self.output_dir = Path(output_dir)
         self.logo_path = DEFAULT_FUS_LOGO_PATH
 
         # Layout configuration
@@ -99,9 +101,7 @@ class GenerateReport:
         """
         serial_num = self.metadata.get("ds50_serial", "").replace("#", "")
         if filename is None:
-            filename = (
-                Path(self.output_dir) / f"{PDF_REPORT_NAME_PREFIX}{serial_num}.pdf"
-            )
+            filename = self.output_dir / f"{PDF_REPORT_NAME_PREFIX}{serial_num}.pdf"
         else:
             filename = Path(filename)
 
@@ -116,22 +116,15 @@ class GenerateReport:
                 )
                 raise FileExistsError(msg)
 
-        # Make the directory if it doesn't exist
-        output_path = Path(self.output_dir)
+        # Make the directory if it doesn't exist. mkdir(exist_ok=True) also
+        # raises if the path exists but is not a directory, so no re-check.
+        output_path = self.output_dir
         try:
             output_path.mkdir(parents=True, exist_ok=True)
         except (OSError, PermissionError) as e:
             msg = f"Failed to create output directory '{output_path}': {e}"
             raise OSError(msg) from e
 
-        # Verify directory was actually created
-        if not output_path.exists() or not output_path.is_dir():
-            msg = (
-                f"Output directory does not exist or is not a directory: "
-                f"'{output_path}'"
-            )
-            raise OSError(msg)
-
         # Call remaining draw methods
         self._build_report_base(self.layout.left_margin_mm)
         self._build_header(logo_path=self.logo_path)
@@ -336,6 +329,33 @@ class GenerateReport:
             return f"{value} {unit}" if unit else str(value)
         return f"{value}"
 
+    @staticmethod
+    @cache
+    def _spec_cell_texts(idx: int) -> tuple[str, str, str]:
+        """Return the spec min/max cell texts and unit for a test table row.
+
+        Specs come from static config, so the texts are built once per row
+        index and reused by every report.
+
+        Args:
+            idx: The row index.
+
+        Returns:
+            Tuple of (spec_min_text, spec_max_text, unit).
+
+        """
+        spec_key = ROW_SPEC_MAPPING[idx]
+        spec: tuple[float | int | None, float | int | None]
+        spec = (
+            DS50_SPEC_RANGES.get(spec_key, (None, None)) if spec_key else (None, None)
+        )
+        unit = DS50_SPEC_UNITS.get(spec_key, "") if spec_key else ""
+        return (
+            GenerateReport.format_spec_value(spec[0], unit),
+            GenerateReport.format_spec_value(spec[1], unit),
+            unit,
+        )
+
     def _add_test_row(
         self,
         table: Table,
@@ -374,20 +394,14 @@ class GenerateReport:
         row.cell(pass_fail_text, align="C", style=styles["data"])
 
         # Get specs and units
-        spec_key = ROW_SPEC_MAPPING[idx]
-        spec: tuple[float | int | None, float | int | None]
-        spec = (
-            DS50_SPEC_RANGES.get(spec_key, (None, None)) if spec_key else (None, None)
-        )
-        unit = DS50_SPEC_UNITS.get(spec_key, "") if spec_key else ""
+        spec_min_text, spec_max_text, unit = self._spec_cell_texts(idx)
+        spec_style = styles["spec"]
 
         # Column 3: Spec Min
-        spec_min_text = self.format_spec_value(spec[0], unit)
-        row.cell(spec_min_text, align="C", style=styles["spec"])
+        row.cell(spec_min_text, align="C", style=spec_style)
 
         # Column 4: Spec Max
-        spec_max_text = self.format_spec_value(spec[1], unit)
-        row.cell(spec_max_text, align="C", style=styles["spec"])
+        row.cell(spec_max_text, align="C", style=spec_style)
 
         # Column 5: Data Measured
         data_measured: float | int | str | None = row_data.get("measured")
@@ -518,9 +532,7 @@ class GenerateReport:
         """
         # Calculate optimal figure dimensions
         # Width: Full page width minus margins
-        figure_width_mm = (
-            self.pdf.w - self.layout.left_margin_mm - self.layout.right_margin_mm
-        )
+        figure_width_mm = self.pdf.w - self.layout.horizontal_margins_mm
 
         # Height: Remaining vertical space minus bottom margin
         # Available height = Page Height - Current Y - Bottom Margin
@@ -533,8 +545,8 @@ class GenerateReport:
 
         # Calculate figure size in inches for matplotlib
         # We use the exact dimensions calculated above
-        figure_width_inches = figure_width_mm / 25.4
-        figure_height_inches = figure_height_mm / 25.4
+        figure_width_inches = figure_width_mm * MM_TO_INCH
+        figure_height_inches = figure_height_mm * MM_TO_INCH
 
         # Create the figure using pure plotting function
         figure = make_time_series_figure(
@@ -544,23 +556,15 @@ class GenerateReport:
             dpi=self.figure_config.dpi,
         )
 
-        # Save to temporary file
-        # bbox_inches=None ensures the saved image matches size_inches exactly
-        temp_path = save_figure_to_temp_file(figure, str(Path.cwd()))
+        # Render in memory rather than round-tripping through a temp file
+        png = render_figure_to_png(figure)
 
-        try:
-            # Add to PDF
-            self.pdf.image(
-                temp_path,
-                x=self.layout.left_margin_mm,
-                w=figure_width_mm,
-                h=figure_height_mm,
-            )
-
-        finally:
-            # Clean up temporary file
-            with contextlib.suppress(OSError):
-                Path(temp_path).unlink()
+        self.pdf.image(
+            png,
+            x=self.layout.left_margin_mm,
+            w=figure_width_mm,
+            h=figure_height_mm,
+        )
 
 
 if __name__ == "__main__":
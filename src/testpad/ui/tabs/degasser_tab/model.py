@@ -21,8 +21,23 @@ from .config import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
     from datetime import date
 
+# Data sections tracked by DegasserModel revision counters
+METADATA_SECTION = "metadata"
+MEASUREMENTS_SECTION = "measurements"
+TEMPERATURE_SECTION = "temperature"
+TEST_ROWS_SECTION = "test_rows"
+OUTPUT_DIRECTORY_SECTION = "output_directory"
+MODEL_SECTIONS = (
+    METADATA_SECTION,
+    MEASUREMENTS_SECTION,
+    TEMPERATURE_SECTION,
+    TEST_ROWS_SECTION,
+    OUTPUT_DIRECTORY_SECTION,
+)
+
 
 # ------------------ Data Structures ------------------
 @dataclass
@@ -46,6 +61,15 @@ class TimeSeriesState:
     temperature_c: float | None = None
 
 
+@dataclass(frozen=True)
+class CsvImport:
+    """Time series parsed from a CSV file, not yet applied to the model."""
+
+    source_path: str
+    oxygen_data: dict[int, float]
+    temperature_c: float | None = None
+
+
 @dataclass
 class Metadata:
     """Metadata Data Class."""
@@ -103,6 +127,12 @@ class DegasserModel:
 
         self._metadata = Metadata(test_date=DEFAULT_TEST_DATE())
 
+        # Revision counters per data section, bumped by every mutator so the
+        # presenter can reuse projections of sections that have not changed.
+        self._revisions: dict[str, int] = dict.fromkeys(MODEL_SECTIONS, 0)
+        # Bumped alongside any section revision; cheap whole-model check
+        self._version = 0
+
     @staticmethod
     def _create_default_test_rows() -> list[TestResultRow]:
         """Create test result rows initialized with spec ranges from config.
@@ -133,6 +163,35 @@ class DegasserModel:
             )
         return rows
 
+    # -------- Revision Tracking --------
+    def _touch(self, *sections: str) -> None:
+        """Bump the revision counter of each given data section."""
+        for section in sections:
+            self._revisions[section] += 1
+        self._version += 1
+
+    def get_version(self) -> int:
+        """Return a counter that increases whenever any data section changes."""
+        return self._version
+
+    def get_revision(self, section: str) -> int:
+        """Return the revision counter for a data section.
+
+        Args:
+            section: One of MODEL_SECTIONS.
+
+        Returns:
+            Counter that increases every time the section is mutated.
+
+        Raises:
+            ValueError: If the section is unknown.
+
+        """
+        if section not in self._revisions:
+            msg = f"Unknown model section: {section}"
+            raise ValueError(msg)
+        return self._revisions[section]
+
     # -------- Validation Helpers --------
     @staticmethod
     def _validate_minute(minute: int) -> None:
@@ -175,6 +234,35 @@ class DegasserModel:
             msg = f"Unknown metadata field: {field}"
             raise ValueError(msg)
         setattr(self._metadata, field, value)
+        self._touch(METADATA_SECTION)
+
+    def set_tester_name(self, name: str) -> None:
+        """Update the tester name."""
+        if name == self._metadata.tester_name:
+            return
+        self._metadata.tester_name = name
+        self._touch(METADATA_SECTION)
+
+    def set_location(self, location: str) -> None:
+        """Update the test location."""
+        if location == self._metadata.location:
+            return
+        self._metadata.location = location
+        self._touch(METADATA_SECTION)
+
+    def set_ds50_serial(self, serial: str) -> None:
+        """Update the DS-50 serial number."""
+        if serial == self._metadata.ds50_serial:
+            return
+        self._metadata.ds50_serial = serial
+        self._touch(METADATA_SECTION)
+
+    def set_test_date(self, test_date: date) -> None:
+        """Update the test date."""
+        if test_date == self._metadata.test_date:
+            return
+        self._metadata.test_date = test_date
+        self._touch(METADATA_SECTION)
 
     def get_metadata(self) -> Metadata:
         """Return a copy of the current metadata."""
@@ -185,12 +273,14 @@ class DegasserModel:
         """Insert or update the oxygen reading for a specific minute slot."""
         self._validate_minute(minute)
         self._oxygen_data[minute] = self._validate_oxygen(oxygen_mg_per_l)
+        self._touch(MEASUREMENTS_SECTION)
         return self.get_state()
 
     def clear_measurement(self, minute: int) -> TimeSeriesState:
         """Remove any stored reading for the given minute (no-op if missing)."""
         self._validate_minute(minute)
-        self._oxygen_data.pop(minute, None)
+        if self._oxygen_data.pop(minute, None) is not None:
+            self._touch(MEASUREMENTS_SECTION)
         return self.get_state()
 
     def list_measurements(self) -> list[tuple[int, float]]:
@@ -212,12 +302,16 @@ class DegasserModel:
         except Exception as e:
             msg = "Temperature must be numeric."
             raise ValueError(msg) from e
-        self._temperature_c = t
+        if t != self._temperature_c:
+            self._temperature_c = t
+            self._touch(TEMPERATURE_SECTION)
         return self.get_state()
 
     def clear_temperature(self) -> TimeSeriesState:
         """Reset the optional temperature reading back to an unset state."""
-        self._temperature_c = None
+        if self._temperature_c is not None:
+            self._temperature_c = None
+            self._touch(TEMPERATURE_SECTION)
         return self.get_state()
 
     def get_temperature_c(self) -> float | None:
@@ -248,6 +342,49 @@ class DegasserModel:
             ValueError: If the index is out of range.
 
         """
+        self._apply_test_row_update(index, pass_fail, spec_min, spec_max, measured)
+        self._touch(TEST_ROWS_SECTION)
+        return self.get_test_rows()
+
+    def update_test_rows(
+        self, updates: Iterable[tuple[int, Mapping[str, Any]]]
+    ) -> list[TestResultRow]:
+        """Apply several row updates, bumping the test rows revision once.
+
+        Args:
+            updates: (index, fields) pairs, where fields holds keyword arguments
+                accepted by update_test_row.
+
+        Raises:
+            ValueError: If any update is rejected. The remaining updates are
+                still applied and the message lists every rejected update.
+
+        """
+        errors: list[str] = []
+        applied = False
+        for index, fields in updates:
+            try:
+                self._apply_test_row_update(index, **fields)
+            except ValueError as e:
+                errors.append(f"row {index}: {e}")
+            else:
+                applied = True
+        if applied:
+            self._touch(TEST_ROWS_SECTION)
+        if errors:
+            msg = "; ".join(errors)
+            raise ValueError(msg)
+        return self.get_test_rows()
+
+    def _apply_test_row_update(
+        self,
+        index: int,
+        pass_fail: str | None = None,
+        spec_min: float | str | None = None,
+        spec_max: float | str | None = None,
+        measured: float | str | None = None,
+    ) -> None:
+        """Mutate a single test row without touching its revision."""
         if not (0 <= index < len(self._test_rows)):
             msg = "Test row index out of range."
             raise ValueError(msg)
@@ -275,8 +412,6 @@ class DegasserModel:
         if pass_fail is not None:
             row.pass_fail = pass_fail
 
-        return self.get_test_rows()
-
     def _auto_validate_pass_fail(self, row: TestResultRow) -> None:
         """Auto-validate the pass/fail status of a test row.
 
@@ -338,25 +473,44 @@ class DegasserModel:
         Raises:
             ValueError on first invalid row.
 
+        """
+        return self.apply_csv_import(self.read_csv(path))
+
+    @classmethod
+    def read_csv(cls, path: str) -> CsvImport:
+        """Parse a time series CSV without touching any model state.
+
+        Safe to call from a worker thread; pass the result to
+        `apply_csv_import` on the owning thread.
+
+        Args:
+            path (str): The file path to load the CSV data from.
+
+        Returns:
+            The parsed readings and optional temperature.
+
+        Raises:
+            ValueError on first invalid row.
+
         """
         time_aliases = {"time", "Time", "minute", "minutes", "t_min"}
         oxy_aliases = {"oxygen", "oxygen_mg_per_L", "o2", "O2", "do2", "DO2"}
         temp_aliases = {"temperature_c", "temp_c", "Temperature", "temp"}
 
-        self._source_path = path
-        with Path(path).open("r", encoding="utf-8") as f:
+        oxygen_data: dict[int, float] = {}
+        temperature_c: float | None = None
+        # Rows are streamed from the reader; only the per-minute readings are
+        # kept. newline="" lets the csv module handle line endings itself.
+        with Path(path).open("r", newline="", encoding="utf-8") as f:
             reader = csv.DictReader(f)
             if reader.fieldnames is None:
                 msg = "CSV missing header row."
                 raise ValueError(msg)
             headers = set(reader.fieldnames)
 
-            time_col = self._resolve_header(headers, time_aliases, required_col=True)
-            oxy_col = self._resolve_header(headers, oxy_aliases, required_col=True)
-            temp_col = self._resolve_header(headers, temp_aliases, required_col=False)
-
-            # Start fresh
-            self._oxygen_data.clear()
+            time_col = cls._resolve_header(headers, time_aliases, required_col=True)
+            oxy_col = cls._resolve_header(headers, oxy_aliases, required_col=True)
+            temp_col = cls._resolve_header(headers, temp_aliases, required_col=False)
 
             # Type narrowing:
             # time_col and oxy_col are not None because required_col=True
@@ -373,18 +527,37 @@ class DegasserModel:
                 if raw_time == "" or raw_oxy == "":
                     msg = f"Blank time or oxygen at line {line_no}."
                     raise ValueError(msg)
-                minute = self._coerce_minute(raw_time)
-                oxy_val = self._validate_oxygen(raw_oxy)
-                self._oxygen_data[minute] = oxy_val  # overwrite if duplicate
+                minute = cls._coerce_minute(raw_time)
+                oxy_val = cls._validate_oxygen(raw_oxy)
+                oxygen_data[minute] = oxy_val  # overwrite if duplicate
                 if temp_col:
                     raw_temp = row.get(temp_col, "").strip()
                     if raw_temp:
                         try:
-                            self._temperature_c = float(raw_temp)
+                            temperature_c = float(raw_temp)
                         except ValueError as e:
                             msg = f"Invalid temperature at line {line_no}: {raw_temp}"
                             raise ValueError(msg) from e
 
+        return CsvImport(
+            source_path=path, oxygen_data=oxygen_data, temperature_c=temperature_c
+        )
+
+    def apply_csv_import(self, imported: CsvImport) -> TimeSeriesState:
+        """Replace the time series with readings parsed by `read_csv`.
+
+        The stored temperature is only replaced if the CSV provided one.
+
+        Args:
+            imported: Result of a previous `read_csv` call.
+
+        """
+        self._source_path = imported.source_path
+        self._oxygen_data = dict(imported.oxygen_data)
+        self._touch(MEASUREMENTS_SECTION)
+        if imported.temperature_c is not None:
+            self._temperature_c = imported.temperature_c
+            self._touch(TEMPERATURE_SECTION)
         return self.get_state()
 
     def export_csv(
@@ -399,18 +572,45 @@ class DegasserModel:
             include_temperature (bool): If True, includes the temperature
                 column if set. Defaults to True.
 
+        """
+        self.write_csv_rows(path, self.build_csv_rows(include_temperature))
+
+    def build_csv_rows(self, include_temperature: bool = True) -> list[list[Any]]:
+        """Snapshot the time series as CSV rows, header row first.
+
+        Args:
+            include_temperature (bool): If True, includes the temperature
+                column if set. Defaults to True.
+
+        Returns:
+            Rows ready for `write_csv_rows`.
+
+        """
+        with_temperature = include_temperature and self._temperature_c is not None
+        cols: list[Any] = ["minute", "oxygen_mg_per_L"]
+        if with_temperature:
+            cols.append("temperature_c")
+        rows = [cols]
+        for minute, oxy in self.list_measurements():
+            row: list[Any] = [minute, oxy]
+            if with_temperature:
+                row.append(self._temperature_c)
+            rows.append(row)
+        return rows
+
+    @staticmethod
+    def write_csv_rows(path: str, rows: list[list[Any]]) -> None:
+        """Write rows from `build_csv_rows` to disk.
+
+        Safe to call from a worker thread as it does not read model state.
+
+        Args:
+            path (str): The file path to write the CSV data to.
+            rows: Rows to write, header row first.
+
         """
         with Path(path).open("w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            cols = ["minute", "oxygen_mg_per_L"]
-            if include_temperature and self._temperature_c is not None:
-                cols.append("temperature_c")
-            writer.writerow(cols)
-            for minute, oxy in self.list_measurements():
-                row = [minute, oxy]
-                if include_temperature and self._temperature_c is not None:
-                    row.append(self._temperature_c)
-                writer.writerow(row)
+            csv.writer(f).writerows(rows)
 
     # -------- Output Directory --------
     def get_output_directory(self) -> Path:
@@ -438,6 +638,7 @@ class DegasserModel:
             raise ValueError(msg)
 
         self._output_directory = path
+        self._touch(OUTPUT_DIRECTORY_SECTION)
 
     # -------- State / Reset / Serialization --------
     def reset(self) -> TimeSeriesState:
@@ -447,6 +648,7 @@ class DegasserModel:
         self._test_rows = self._create_default_test_rows()
         self._source_path = None
         self._metadata = Metadata(test_date=DEFAULT_TEST_DATE())
+        self._touch(*MODEL_SECTIONS)
         return self.get_state()
 
     def validate_for_report(self) -> list[str]:
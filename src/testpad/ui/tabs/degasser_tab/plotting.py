@@ -3,11 +3,8 @@
 This module provides pure functions for creating matplotlib figures
 """
 
-import contextlib
-import os
-import tempfile
+import io
 from collections.abc import Mapping, Sequence
-from pathlib import Path
 
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
@@ -63,34 +60,26 @@ def make_time_series_figure(
     return fig
 
 
-def save_figure_to_temp_file(
-    figure: Figure, output_dir: str = ".", bbox_inches: str | None = "tight"
-) -> str:
-    """Save a matplotlib figure to a temporary PNG file.
+def render_figure_to_png(
+    figure: Figure, bbox_inches: str | None = "tight"
+) -> io.BytesIO:
+    """Render a matplotlib figure to an in-memory PNG.
+
+    Uses the figure's own Agg canvas (no GUI toolkit), so it is safe to call
+    from a worker thread.
 
     Args:
-        figure: matplotlib Figure to save
-        output_dir: Directory to save the temporary file
+        figure: matplotlib Figure to render
         bbox_inches: Bbox strategy for saving (default: "tight")
 
     Returns:
-        Path to the saved PNG file
+        Buffer holding the PNG data, rewound to the start
 
     """
-    # Create temporary file
-    temp_fd, temp_path = tempfile.mkstemp(suffix=".png", dir=output_dir)
-    os.close(temp_fd)  # Close the file descriptor
-
-    try:
-        figure.savefig(temp_path, dpi=figure.get_dpi(), bbox_inches=bbox_inches)
-
-    except Exception:
-        # Clean up on error
-        with contextlib.suppress(OSError):
-            Path(temp_path).unlink()
-        raise
-    else:
-        return temp_path
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format="png", dpi=figure.get_dpi(), bbox_inches=bbox_inches)
+    buffer.seek(0)
+    return buffer
 
 
 def normalize_time_series_data(
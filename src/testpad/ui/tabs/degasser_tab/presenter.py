@@ -4,26 +4,77 @@ This module handles the logic for the degasser tab such as
 updating the view and handling user input.
 """
 
+import functools
+import time
+from contextlib import contextmanager
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
+
+from PySide6.QtCore import QDate, QObject, QTimer, Slot
+
+from testpad.utils.background_task import BackgroundTask, run_in_background
 
 from .config import (
+    CSV_EXPORT_NAME_PREFIX,
+    CSV_EXPORT_TIMESTAMP_FORMAT,
     MEASURED_COL_INDEX,
     PASS_FAIL_COL_INDEX,
 )
-from .generate_pdf_report import GenerateReport
-from .model import DegasserModel
+from .model import (
+    MEASUREMENTS_SECTION,
+    METADATA_SECTION,
+    MODEL_SECTIONS,
+    OUTPUT_DIRECTORY_SECTION,
+    TEMPERATURE_SECTION,
+    TEST_ROWS_SECTION,
+    CsvImport,
+    DegasserModel,
+)
 from .view_state import DegasserViewState
 
 if TYPE_CHECKING:
-    from PySide6.QtCore import QDate
+    from collections.abc import Callable, Generator
 
+    from .generate_pdf_report import GenerateReport
     from .view import DegasserTab
 
 
-class DegasserPresenter:
-    """Degasser tab presenter."""
+def _logged_errors(
+    prefix: str,
+) -> "Callable[[Callable[..., None]], Callable[..., None]]":
+    """Log ValueErrors raised by a presenter handler instead of propagating them.
+
+    Apply beneath @Slot so the registered slot is the logging wrapper.
+
+    Args:
+        prefix: Text logged in front of the error message.
+
+    Returns:
+        Decorator wrapping a DegasserPresenter method.
+
+    """
+
+    def decorate(handler: "Callable[..., None]") -> "Callable[..., None]":
+        @functools.wraps(handler)
+        def wrapper(self: "DegasserPresenter", *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+            try:
+                handler(self, *args, **kwargs)
+            except ValueError as e:
+                self._view.log_message(f"{prefix}: {e}")
+
+        return wrapper
+
+    return decorate
+
+
+class DegasserPresenter(QObject):
+    """Degasser tab presenter.
+
+    A QObject so its handlers can be registered as Qt slots; it is parented
+    to the view and shares its lifetime.
+    """
 
     def __init__(self, model: DegasserModel, view: "DegasserTab") -> None:
         """Initialize the presenter.
@@ -33,10 +84,30 @@ class DegasserPresenter:
             view: The UI view.
 
         """
+        super().__init__(view)
         self._model = model
         self._view = view
         self._state = DegasserViewState()
         self._updating = False
+        # Nesting depth of _suspend_refresh blocks and whether one was deferred
+        self._refresh_depth = 0
+        self._refresh_pending = False
+        # Model projections keyed by section: (model revision, projection)
+        self._projection_cache: dict[str, tuple[int, Any]] = {}
+        # Last built view state and the model version it was built from
+        self._cached_state: DegasserViewState | None = None
+        self._cached_version = -1
+        # Section revisions the view currently displays
+        self._rendered_revisions: dict[str, int] = {}
+        # Running worker tasks, referenced until their callbacks have run
+        self._background_tasks: set[BackgroundTask] = set()
+        # Test table edits queued within one event loop pass (e.g. a paste)
+        # and applied to the model as a single batch
+        self._pending_test_updates: list[tuple[int, dict[str, Any]]] = []
+        self._test_update_timer = QTimer(self)
+        self._test_update_timer.setSingleShot(True)
+        self._test_update_timer.setInterval(0)
+        self._test_update_timer.timeout.connect(self._flush_test_updates)
 
     def initialize(self) -> None:
         """Call after view is constructed."""
@@ -47,21 +118,24 @@ class DegasserPresenter:
         """Connect view signals to presenter event handlers."""
         self._view.connect_signals(self)
 
+    @Slot(str)
     def on_name_changed(self, text: str) -> None:
         """Handle name edit changes."""
         if self._updating:
             return
-        self._model.set_metadata_field("tester_name", text)
+        self._model.set_tester_name(text)
 
+    @Slot(str)
     def on_location_changed(self, text: str) -> None:
         """Handle location edit changes."""
         if self._updating:
             return
-        self._model.set_metadata_field("location", text)
+        self._model.set_location(text)
 
+    @Slot(QDate)
     def on_date_changed(
         self,
-        date_val: "QDate",
+        date_val: QDate,
     ) -> None:
         """Handle date edit changes."""
         if self._updating:
@@ -69,16 +143,23 @@ class DegasserPresenter:
         if not isinstance(date_val, datetime):
             # Cast to date to satisfy type checker
             py_date = cast("date", date_val.toPython())
-            self._model.set_metadata_field("test_date", py_date)
+            self._model.set_test_date(py_date)
 
+    @Slot(str)
     def on_serial_changed(self, text: str) -> None:
         """Handle serial edit changes."""
         if self._updating:
             return
-        self._model.set_metadata_field("ds50_serial", text)
+        self._model.set_ds50_serial(text)
 
+    @Slot(int, int)
     def on_test_table_cell_changed(self, row: int, column: int) -> None:
-        """Handle test table cell changes."""
+        """Handle test table cell changes.
+
+        Edits are queued and applied together once control returns to the
+        event loop, so pasting a block of cells costs one model update and
+        one refresh.
+        """
         if self._updating:
             return
         if column == 0:
@@ -87,37 +168,36 @@ class DegasserPresenter:
         # Get cell value (already returns a string, stripped)
         value = self._view.get_test_table_cell_value(row, column)
 
-        try:
-            if column == PASS_FAIL_COL_INDEX:  # Pass/Fail
-                self._model.update_test_row(row, pass_fail=value)
-            elif column == MEASURED_COL_INDEX:  # Data Measured
-                self._model.update_test_row(
-                    row, measured=None if value.strip() == "" else value
-                )
-                # Refresh view to show auto-calculated Pass/Fail
-                self._refresh_view()
-
-        except ValueError as e:
-            self._view.log_message(f"Test table error: {e}")
-
-    def on_pass_fail_changed(self, row: int, value: str) -> None:
-        """Handle pass/fail combo box changes.
-
-        Args:
-            row (int): The row index of the test table.
-            value (str): The new pass/fail value from the combo box.
+        if column == PASS_FAIL_COL_INDEX:  # Pass/Fail
+            fields = {"pass_fail": value}
+        elif column == MEASURED_COL_INDEX:  # Data Measured
+            fields = {"measured": None if value.strip() == "" else value}
+        else:
+            return
 
-        Raises:
-            ValueError: If the value is invalid.
+        self._pending_test_updates.append((row, fields))
+        self._test_update_timer.start()
 
-        """
-        if self._updating:
+    @Slot()
+    @_logged_errors("Test table error")
+    def _flush_test_updates(self) -> None:
+        """Apply queued test table edits to the model in one batch."""
+        self._test_update_timer.stop()
+        if not self._pending_test_updates:
             return
+        updates, self._pending_test_updates = self._pending_test_updates, []
         try:
-            self._model.update_test_row(row, pass_fail=value)
-        except ValueError as e:
-            self._view.log_message(f"Pass/Fail error: {e}")
+            self._model.update_test_rows(updates)
+        except ValueError:
+            # Put the stored values back into the rejected cells
+            self._invalidate_view(TEST_ROWS_SECTION)
+            raise
+        finally:
+            # Rejected edits still leave the valid ones applied; show them and
+            # the auto-calculated Pass/Fail
+            self._refresh_view()
 
+    @Slot(int, int)
     def on_time_series_changed(self, row: int, column: int) -> None:
         """Handle time series table cell changes.
 
@@ -156,6 +236,8 @@ class DegasserPresenter:
         except ValueError as e:
             self._view.log_message(f"Invalid oxygen level at minute {column}: {e}")
 
+    @Slot(str)
+    @_logged_errors("Temperature error")
     def on_temperature_changed(self, temp: str | None = None) -> None:
         """Handle temperature edit changes.
 
@@ -168,17 +250,17 @@ class DegasserPresenter:
         """
         if self._updating:
             return
+        revision = self._model.get_revision(TEMPERATURE_SECTION)
         if temp == "":
             self._model.clear_temperature()
-            self._refresh_view()
         else:
             temp = cast("str", temp).strip()
-            try:
-                self._model.set_temperature(temp)
-                self._refresh_view()
-            except ValueError as e:
-                self._view.log_message(f"Temperature error: {e}")
+            self._model.set_temperature(temp)
+        # Edits that leave the stored value as-is (e.g. "21" -> "21.0") skip it
+        if self._model.get_revision(TEMPERATURE_SECTION) != revision:
+            self._refresh_view()
 
+    @Slot()
     def on_select_output_folder_clicked(self) -> None:
         """Handle output folder selection button click."""
         if self._updating:
@@ -204,10 +286,12 @@ class DegasserPresenter:
             self._refresh_view()
             self._view.log_message(f"Output folder set to {path}")
 
+    @Slot()
     def on_reset(self) -> None:
         """Handle reset button click - clear all data."""
         if self._updating:
             return
+        self._flush_test_updates()
 
         # Confirmation dialog
         reply = self._view.question_dialog(
@@ -216,22 +300,21 @@ class DegasserPresenter:
         )
 
         if reply:
-            self._model.reset()
-            self._refresh_view()
+            with self._suspend_refresh():
+                self._model.reset()
+                self._refresh_view()
             self._view.log_message("All data reset.")
 
+    @Slot()
     def on_generate_report(self) -> None:
         """Generate a PDF report when 'Generate Report' button is clicked.
 
-        Passes data to model for report generation.
-
-        Raises:
-            ValueError: If report generation fails due to invalid state.
-            Exception: For any other unexpected errors.
-
+        Snapshots the model data and builds the report on a worker thread;
+        errors are reported back through dialogs on the GUI thread.
         """
         if self._updating:
             return
+        self._flush_test_updates()
 
         # Validate any missing values before report generation
         missing_values = self._model.validate_for_report()
@@ -248,6 +331,9 @@ class DegasserPresenter:
 
         output_path = self._model.get_output_directory()
 
+        # Imported on first use: fpdf is only needed once a report is requested
+        from .generate_pdf_report import GenerateReport  # noqa: PLC0415
+
         report_generator = GenerateReport(
             time_series=time_series,
             metadata=metadata,
@@ -255,61 +341,87 @@ class DegasserPresenter:
             temperature=temperature_c,
             output_dir=output_path,
         )
-        try:
-            report_generator.generate_report()
+        self._start_report(report_generator, auto_increment=False)
+
+    def _start_report(
+        self, report_generator: "GenerateReport", *, auto_increment: bool
+    ) -> None:
+        """Build the PDF on a worker thread and report the outcome.
+
+        The Generate Report button stays disabled while the worker runs so a
+        second click cannot start a concurrent build of the same file.
+
+        Args:
+            report_generator: Generator holding a snapshot of the model data.
+            auto_increment: Pick the next free filename instead of failing
+                when the report already exists.
+
+        """
+        self._view.set_report_generation_running(running=True)
+
+        def on_generated(generated_file: Path) -> None:
+            self._view.set_report_generation_running(running=False)
             msg = (
                 "Report generated successfully. The report was saved to:\n"
-                f"{output_path}"
+                f"{generated_file.parent}"
             )
             self._view.log_message(msg)
             self._view.info_dialog(title="Report Generated", text=msg)
-        except FileExistsError:
-            # Ask user how to handle
-            title = "Report already exists"
-            serial = data_dict["metadata"]["ds50_serial"]
-            msg = (
-                f"A file with the serial number '{serial}' already exists.\n"
-                "How do you want to proceed?"
-            )
 
-            response = self._view.existing_file_dialog(title=title, text=msg)
-
-            if response == "create_new_file":
-                try:
-                    # Let GenerateReport handle incrementing
-                    generated_file = report_generator.generate_report(
-                        auto_increment=True,
-                    )
-                    msg = (
-                        "Report generated successfully. The report was saved to:\n"
-                        f"{generated_file.parent}"
-                    )
-                    self._view.log_message(msg)
-                    self._view.info_dialog(title="Report Generated", text=msg)
-                except (ValueError, OSError) as err:
-                    self._view.log_message(f"Error: {err}")
-                    self._view.critical_dialog(
-                        title="Error Generating Report",
-                        text=f"Failed to generate report: {err}",
-                    )
-            elif response == "change_serial":
-                # Cancel to allow user to change serial number
-                return
+        def on_error(e: Exception) -> None:
+            self._view.set_report_generation_running(running=False)
+            if isinstance(e, FileExistsError) and not auto_increment:
+                self._on_report_exists(report_generator)
+            elif auto_increment:
+                self._view.log_message(f"Error: {e}")
+                self._view.critical_dialog(
+                    title="Error Generating Report",
+                    text=f"Failed to generate report: {e}",
+                )
             else:
-                # User cancelled
-                self._view.log_message("Report generation cancelled")
-
-        except (ValueError, OSError, PermissionError) as e:
-            self._view.log_message(f"Report generation error: {e}")
-            self._view.critical_dialog(
-                title="Report Generation Error",
-                text=f"Failed to generate report: {e}"
-                "\nConfirm the following before proceeding:"
-                "\n- Ensure you have write permissions for the output directory."
-                "\n- Close any open instances of the report file if it already exists."
-                "\n- Check if the output directory is valid and accessible."
-                f"\n\nOutput directory: {output_path}",
-            )
+                self._view.log_message(f"Report generation error: {e}")
+                self._view.critical_dialog(
+                    title="Report Generation Error",
+                    text=f"Failed to generate report: {e}"
+                    "\nConfirm the following before proceeding:"
+                    "\n- Ensure you have write permissions for the output directory."
+                    "\n- Close any open instances of the report file if it already "
+                    "exists."
+                    "\n- Check if the output directory is valid and accessible."
+                    f"\n\nOutput directory: {report_generator.output_dir}",
+                )
+
+        self._start_background(
+            lambda: report_generator.generate_report(auto_increment=auto_increment),
+            on_generated,
+            on_error,
+        )
+
+    def _on_report_exists(self, report_generator: "GenerateReport") -> None:
+        """Ask the user how to handle a report file that already exists.
+
+        Args:
+            report_generator: Generator whose target file already exists.
+
+        """
+        title = "Report already exists"
+        serial = report_generator.metadata["ds50_serial"]
+        msg = (
+            f"A file with the serial number '{serial}' already exists.\n"
+            "How do you want to proceed?"
+        )
+
+        response = self._view.existing_file_dialog(title=title, text=msg)
+
+        if response == "create_new_file":
+            # Let GenerateReport handle incrementing
+            self._start_report(report_generator, auto_increment=True)
+        elif response == "change_serial":
+            # Cancel to allow user to change serial number
+            return
+        else:
+            # User cancelled
+            self._view.log_message("Report generation cancelled")
 
     def _prompt_continue_missing_values(self, warnings: list[str]) -> bool:
         """Handle missing values dialog.
@@ -331,13 +443,12 @@ class DegasserPresenter:
         )
         return self._view.missing_values_dialog(title, message)
 
-    def _on_import_csv(self) -> None:
+    @Slot()
+    def on_import_csv_clicked(self) -> None:
         """Handle import CSV button click.
 
-        Raises:
-            ValueError: If import fails due to invalid file format.
-            Exception: For any other unexpected errors.
-
+        The file is parsed on a worker thread; the model is only updated once
+        parsing succeeded, back on the GUI thread.
         """
         if self._updating:
             return
@@ -350,51 +461,144 @@ class DegasserPresenter:
         if not path:  # User cancelled
             return
 
-        try:
-            self._model.load_from_csv(path)
-            self._refresh_view()  # Update UI with loaded data
+        def on_parsed(imported: CsvImport) -> None:
+            self._view.set_csv_transfer_running(running=False)
+            with self._suspend_refresh():
+                self._model.apply_csv_import(imported)
+                self._refresh_view()  # Update UI with loaded data
             self._view.log_message(f"✅ Imported data from {path}")
-        except ValueError as e:
+
+        def on_error(e: Exception) -> None:
+            self._view.set_csv_transfer_running(running=False)
             self._view.log_message(f"❌ Import error: {e}")
 
-    def _on_export_csv(self) -> None:
-        """Handle export CSV button click.
+        # A second transfer must not start until this one has been applied
+        self._view.set_csv_transfer_running(running=True)
+        self._start_background(
+            lambda: DegasserModel.read_csv(path), on_parsed, on_error
+        )
 
-        Raises:
-            ValueError: If export fails due to invalid state.
-            Exception: For any other unexpected errors.
+    @Slot()
+    def on_export_csv_clicked(self) -> None:
+        """Handle export CSV button click.
 
+        Rows are snapshotted on the GUI thread and written by a worker thread.
         """
         if self._updating:
             return
-        timestamp = datetime.now().strftime("%y%m%d-%H%M")
+        self._flush_test_updates()
 
         path = self._view.show_file_save_dialog(
             "Export Degasser Data",
-            f"degasser_data_{timestamp}.csv",
+            self._default_export_name(),
             "CSV Files (*.csv);;All Files (*)",
         )
 
         if not path:  # User cancelled
             return
 
-        try:
-            self._model.export_csv(path)
+        rows = self._model.build_csv_rows()
+
+        def on_written(_: None) -> None:
+            self._view.set_csv_transfer_running(running=False)
             self._view.log_message(f"✅ Exported data to {path}")
-        except ValueError as e:
+
+        def on_error(e: Exception) -> None:
+            self._view.set_csv_transfer_running(running=False)
             self._view.log_message(f"❌ Export error: {e}")
 
+        self._view.set_csv_transfer_running(running=True)
+        self._start_background(
+            lambda: DegasserModel.write_csv_rows(path, rows), on_written, on_error
+        )
+
+    @staticmethod
+    def _default_export_name() -> str:
+        """Return the suggested CSV export filename for the current local time."""
+        # time.strftime formats local time without building a datetime object
+        timestamp = time.strftime(CSV_EXPORT_TIMESTAMP_FORMAT)
+        return f"{CSV_EXPORT_NAME_PREFIX}{timestamp}.csv"
+
+    def _start_background(
+        self,
+        fn: "Callable[[], Any]",
+        on_success: "Callable[[Any], None]",
+        on_error: "Callable[[Exception], None]",
+    ) -> None:
+        """Run blocking work off the GUI thread, keeping the task alive until done.
+
+        Args:
+            fn: Blocking callable; must not touch the view or mutate the model.
+            on_success: Called on the GUI thread with the result of `fn`.
+            on_error: Called on the GUI thread with the exception raised by `fn`.
+
+        """
+        task: BackgroundTask | None = None
+
+        def finish(callback: "Callable[[Any], None]", value: object) -> None:
+            self._background_tasks.discard(task)
+            callback(value)
+
+        task = run_in_background(
+            fn,
+            lambda result: finish(on_success, result),
+            lambda error: finish(on_error, error),
+        )
+        self._background_tasks.add(task)
+
+    @contextmanager
+    def _suspend_refresh(self) -> "Generator[None, Any, None]":
+        """Defer view refreshes until the outermost block exits.
+
+        Refreshes requested inside the block are coalesced into a single
+        `_refresh_view` call once the last nested block has exited.
+        """
+        self._refresh_depth += 1
+        try:
+            yield
+        finally:
+            self._refresh_depth -= 1
+            if self._refresh_depth == 0 and self._refresh_pending:
+                self._refresh_pending = False
+                self._refresh_view()
+
     def _refresh_view(self) -> None:
         """Update all view widgets from current model state."""
         if self._updating:
             return
+        if self._refresh_depth:
+            self._refresh_pending = True
+            return
+        revisions = {
+            section: self._model.get_revision(section) for section in MODEL_SECTIONS
+        }
+        changed = frozenset(
+            section
+            for section, revision in revisions.items()
+            if self._rendered_revisions.get(section) != revision
+        )
+        if not changed:
+            return
         self._updating = True
         try:
-            state = self._build_view_state()
+            state = replace(self._build_view_state(), changed_sections=changed)
             self._view.update_view(state)
+            self._rendered_revisions = revisions
         finally:
             self._updating = False
 
+    def _invalidate_view(self, *sections: str) -> None:
+        """Re-render the given sections on the next refresh even if unchanged.
+
+        Used when the view shows input the model rejected.
+
+        Args:
+            sections: Model sections to re-render.
+
+        """
+        for section in sections:
+            self._rendered_revisions.pop(section, None)
+
     def _build_view_state(self) -> DegasserViewState:
         """Build a complete ViewState from the current model state.
 
@@ -406,16 +610,29 @@ class DegasserPresenter:
             DegasserViewState containing all current display data
 
         """
-        # Gather all data from model
-        metadata = self._model.get_metadata()
-        measurements = self._model.list_measurements()
+        version = self._model.get_version()
+        if self._cached_state is not None and self._cached_version == version:
+            return self._cached_state
+
+        # Gather all data from model, reusing projections of unchanged sections
+        metadata = self._project(METADATA_SECTION, self._model.get_metadata)
+        measurements, time_series_cells = self._project(
+            MEASUREMENTS_SECTION,
+            lambda: (
+                tuple(self._model.list_measurements()),
+                tuple(self._model.build_time_series_cells()),
+            ),
+        )
         temperature_c = self._model.get_temperature_c()
-        test_rows = self._model.get_test_rows()
-        time_series_cells = self._model.build_time_series_cells()
-        output_dir = self._model.get_output_directory()
+        test_rows = self._project(
+            TEST_ROWS_SECTION, lambda: tuple(self._model.get_test_rows())
+        )
+        output_dir = self._project(
+            OUTPUT_DIRECTORY_SECTION, self._model.get_output_directory
+        )
 
         # Package into ViewState
-        return DegasserViewState(
+        self._cached_state = DegasserViewState(
             tester_name=metadata.tester_name,
             location=metadata.location,
             ds50_serial=metadata.ds50_serial,
@@ -426,6 +643,27 @@ class DegasserPresenter:
             time_series_table_rows=time_series_cells,
             output_directory=str(output_dir),
         )
+        self._cached_version = version
+        return self._cached_state
+
+    def _project(self, section: str, build: "Callable[[], Any]") -> Any:  # noqa: ANN401
+        """Return a cached model projection, rebuilding it only when stale.
+
+        Args:
+            section: Model section the projection is derived from.
+            build: Callable producing the projection from the model.
+
+        Returns:
+            The projection for the current revision of the section.
+
+        """
+        revision = self._model.get_revision(section)
+        cached = self._projection_cache.get(section)
+        if cached is not None and cached[0] == revision:
+            return cached[1]
+        projection = build()
+        self._projection_cache[section] = (revision, projection)
+        return projection
 
     def shutdown(self) -> None:
         """Cleanup hooks/resources."""
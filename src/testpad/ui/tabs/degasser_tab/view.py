@@ -4,15 +4,18 @@ This module provides the user interface for the Degasser Tab.
 """
 
 import sys
+from collections import deque
+from collections.abc import Generator
+from contextlib import ExitStack, contextmanager
+from dataclasses import replace
 from pathlib import Path
-from typing import cast
+from typing import Any
 
-import PySide6.QtCore
-from PySide6.QtCore import QDate, QSignalBlocker, Qt
+from PySide6.QtCore import QDate, QModelIndex, QSignalBlocker, Qt, QTimer
+from PySide6.QtGui import QShowEvent
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
-    QComboBox,
     QDateEdit,
     QFileDialog,
     QGridLayout,
@@ -22,11 +25,10 @@ from PySide6.QtWidgets import (
     QLabel,
     QLineEdit,
     QMessageBox,
+    QPlainTextEdit,
     QPushButton,
     QStyle,
-    QTableWidget,
-    QTableWidgetItem,
-    QTextBrowser,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
@@ -35,36 +37,47 @@ from testpad.config.defaults import ISO_8601_DATE_FORMAT
 from testpad.ui.tabs.base_tab import BaseTab
 from testpad.ui.tabs.degasser_tab.chart_widgets import TimeSeriesChartWidget
 from testpad.ui.tabs.degasser_tab.config import (
-    DEFAULT_TEST_DESCRIPTIONS,
+    CONSOLE_MAX_LINES,
     DEFAULT_TIME_SERIES_TEMP,
-    DS50_DECIMAL_PRECISION,
     DS50_SPEC_RANGES,
     DS50_SPEC_UNITS,
-    HEADER_ROW_COLOR,
     HEADER_ROW_INDEX,
     MEASURED_COL_INDEX,
     METADATA_FIELDS,
-    NO_LIMIT_SYMBOL,
     NUM_TEST_COLS,
-    NUM_TEST_ROWS,
-    NUM_TIME_SERIES_COLS,
-    NUM_TIME_SERIES_ROWS,
+    PASS_FAIL_COL_INDEX,
     ROW_SPEC_MAPPING,
-    SPEC_MAX_COL_INDEX,
-    SPEC_MIN_COL_INDEX,
-    TEST_TABLE_HEADERS,
-    TIME_SERIES_HEADERS,
 )
-from testpad.ui.tabs.degasser_tab.model import DegasserModel, TestResultRow
+from testpad.ui.tabs.degasser_tab.model import (
+    MEASUREMENTS_SECTION,
+    METADATA_SECTION,
+    OUTPUT_DIRECTORY_SECTION,
+    TEMPERATURE_SECTION,
+    TEST_ROWS_SECTION,
+    DegasserModel,
+    TestResultRow,
+)
 from testpad.ui.tabs.degasser_tab.presenter import DegasserPresenter
 from testpad.ui.tabs.degasser_tab.view_state import DegasserViewState
 from testpad.ui.tabs.degasser_tab.widgets.delegates import (
     MeasuredValueDelegate,
+    PassFailDelegate,
     TimeSeriesValueDelegate,
 )
-from testpad.ui.tabs.degasser_tab.widgets.table_widgets import (
-    ColumnMajorTableWidget,
+from testpad.ui.tabs.degasser_tab.widgets.table_models import (
+    TestResultsTableModel,
+    TimeSeriesTableModel,
 )
+from testpad.ui.tabs.degasser_tab.widgets.table_widgets import ColumnMajorTableView
+
+# Metadata field labels, formatted once
+_METADATA_LABELS = {key: f"{label}: " for key, label in METADATA_FIELDS.items()}
+
+
+def _set_text_if_changed(line_edit: QLineEdit, text: str) -> None:
+    """Set a line edit's text only when it differs from the displayed text."""
+    if line_edit.text() != text:
+        line_edit.setText(text)
 
 
 class DegasserTab(BaseTab):
@@ -90,6 +103,18 @@ class DegasserTab(BaseTab):
         self.presenter = presenter
         self._time_series_chart = TimeSeriesChartWidget()
         self._time_series_section: QWidget | None = None
+        # Latest state received while hidden, applied on the next showEvent
+        self._pending_state: DegasserViewState | None = None
+        # Messages not yet written to the console, oldest dropped first. They
+        # are flushed once per event loop pass while the console is open,
+        # and kept until it is expanded while it is collapsed.
+        self._pending_log: deque[str] = deque(maxlen=CONSOLE_MAX_LINES)
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(0)
+        self._log_flush_timer.timeout.connect(
+            self._flush_log, Qt.ConnectionType.DirectConnection
+        )
         self._construct_ui()
 
     def _construct_ui(self) -> None:
@@ -105,6 +130,20 @@ class DegasserTab(BaseTab):
         layout.setRowStretch(3, 0)  # Action buttons not stretchable
         layout.setRowStretch(4, 0)  # Console section not stretchable
 
+        # Input widgets whose change signals reach the presenter, by the state
+        # section that writes them back in _apply_state. The table models are
+        # not listed: update_rows never emits cell_edited, and blocking them
+        # would also swallow the dataChanged their views repaint from.
+        self._section_inputs: dict[str, tuple[QWidget, ...]] = {
+            METADATA_SECTION: (
+                self._name_edit,
+                self._location_edit,
+                self._date_edit,
+                self._serial_edit,
+            ),
+            TEMPERATURE_SECTION: (self._temperature_edit,),
+        }
+
     def update_view(self, state: DegasserViewState) -> None:
         """Update the view based on the provided state.
 
@@ -116,44 +155,83 @@ class DegasserTab(BaseTab):
             state: Complete UI state to accurately update the view
 
         Note: This method handles signal blocking internally to prevent
-            feedback loops during updates.
+            feedback loops during updates. Painting is suspended until all
+            widgets are updated so the tab repaints once per state. Only the
+            widgets of `state.changed_sections` are touched. While the tab is
+            hidden, states are merged and applied when it is next shown.
 
         """
-        self._block_signals(block=True)
-        try:
-            # Update Metadata
-            self._name_edit.setText(state.tester_name)
-            self._location_edit.setText(state.location)
-            self._serial_edit.setText(state.ds50_serial)
-            if state.test_date is not None:
-                # Convert Python date to QDate for type safety
-                qdate = QDate(
-                    state.test_date.year,
-                    state.test_date.month,
-                    state.test_date.day,
+        if not self.isVisible():
+            if self._pending_state is not None:
+                # Keep every section changed since the last applied state
+                state = replace(
+                    state,
+                    changed_sections=state.changed_sections
+                    | self._pending_state.changed_sections,
                 )
-                self._date_edit.setDate(qdate)
-
-            # Update Chart
-            self._time_series_chart.update_plot(
-                state.time_series_measurements, state.temperature_c
-            )
-
-            # Update temperature display
-            # Only update if field is not in focus - user may be editing
-            if not self._temperature_edit.hasFocus():
-                if state.temperature_c is not None:
-                    self._temperature_edit.setText(f"{state.temperature_c:.1f}")
-                else:
-                    self._temperature_edit.setText("")
-
-            self._update_test_table(state.test_rows)
-
-            self._update_time_series_table(state.time_series_table_rows)
-            self._output_dir_line_edit.setText(state.output_directory)
-
+            self._pending_state = state
+            return
+        self._pending_state = None
+        self._apply_state(state)
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """Apply any state that arrived while the tab was hidden."""
+        super().showEvent(event)
+        if self._pending_state is not None:
+            state, self._pending_state = self._pending_state, None
+            self._apply_state(state)
+
+    def _apply_state(self, state: DegasserViewState) -> None:
+        """Render the changed sections of a view state into the widgets."""
+        self.setUpdatesEnabled(False)
+        try:
+            changed = state.changed_sections
+            with self._blocked_signals(changed):
+                # Update Metadata
+                if METADATA_SECTION in changed:
+                    _set_text_if_changed(self._name_edit, state.tester_name)
+                    _set_text_if_changed(self._location_edit, state.location)
+                    _set_text_if_changed(self._serial_edit, state.ds50_serial)
+                    if state.test_date is not None:
+                        # Convert Python date to QDate for type safety
+                        qdate = QDate(
+                            state.test_date.year,
+                            state.test_date.month,
+                            state.test_date.day,
+                        )
+                        if self._date_edit.date() != qdate:
+                            self._date_edit.setDate(qdate)
+
+                # Update Chart
+                if MEASUREMENTS_SECTION in changed or TEMPERATURE_SECTION in changed:
+                    self._time_series_chart.update_plot(
+                        state.time_series_measurements, state.temperature_c
+                    )
+
+                # Update temperature display
+                # Only update if field is not in focus - user may be editing
+                if (
+                    TEMPERATURE_SECTION in changed
+                    and not self._temperature_edit.hasFocus()
+                ):
+                    _set_text_if_changed(
+                        self._temperature_edit,
+                        f"{state.temperature_c:.1f}"
+                        if state.temperature_c is not None
+                        else "",
+                    )
+
+                if TEST_ROWS_SECTION in changed:
+                    self._update_test_table(state.test_rows)
+
+                if MEASUREMENTS_SECTION in changed:
+                    self._update_time_series_table(state.time_series_table_rows)
+                if OUTPUT_DIRECTORY_SECTION in changed:
+                    _set_text_if_changed(
+                        self._output_dir_line_edit, state.output_directory
+                    )
         finally:
-            self._block_signals(block=False)
+            self.setUpdatesEnabled(True)
 
     def connect_signals(self, presenter: "DegasserPresenter") -> None:
         """Connect all view signals to presenter event handlers.
@@ -165,39 +243,37 @@ class DegasserTab(BaseTab):
             presenter: The presenter instance with event handler methods
 
         """
+        # Every handler lives on the GUI thread with its emitter, so connect
+        # directly and skip AutoConnection's per-emit thread check.
+        direct = Qt.ConnectionType.DirectConnection
+
         # Metadata fields
-        self._name_edit.textChanged.connect(presenter.on_name_changed)
-        self._location_edit.textChanged.connect(presenter.on_location_changed)
-        self._date_edit.dateChanged.connect(presenter.on_date_changed)
-        self._serial_edit.textChanged.connect(presenter.on_serial_changed)
+        self._name_edit.textChanged.connect(presenter.on_name_changed, direct)
+        self._location_edit.textChanged.connect(presenter.on_location_changed, direct)
+        self._date_edit.dateChanged.connect(presenter.on_date_changed, direct)
+        self._serial_edit.textChanged.connect(presenter.on_serial_changed, direct)
 
         # Test Table
-        self._test_table.cellChanged.connect(presenter.on_test_table_cell_changed)
+        self._test_model.cell_edited.connect(
+            presenter.on_test_table_cell_changed, direct
+        )
 
         # Time Series
-        self._time_series_widget.cellChanged.connect(presenter.on_time_series_changed)
-        self._temperature_edit.textChanged.connect(presenter.on_temperature_changed)
+        self._time_series_model.cell_edited.connect(
+            presenter.on_time_series_changed, direct
+        )
+        self._temperature_edit.textChanged.connect(
+            presenter.on_temperature_changed, direct
+        )
 
         # Action Buttons
         self._select_output_folder_btn.clicked.connect(
-            presenter.on_select_output_folder_clicked
+            presenter.on_select_output_folder_clicked, direct
         )
-        self._generate_report_btn.clicked.connect(presenter.on_generate_report)
-        self._reset_btn.clicked.connect(presenter.on_reset)
-
-        # Pass/Fail Combo Boxes
-        for row in range(NUM_TEST_ROWS):
-            if row == HEADER_ROW_INDEX:
-                continue
-            combo = self._test_table.cellWidget(row, 1)
-            if combo:
-                combo = cast("QComboBox", combo)
-                combo.textActivated.connect(
-                    lambda text, r=row: presenter.on_pass_fail_changed(r, text)
-                )
-        # TODO: Add CSV import and export connections
-        # self._import_csv_btn.clicked.connect(presenter.on_import_csv_clicked)
-        # self._export_csv_btn.clicked.connect(presenter.on_export_csv_clicked)
+        self._generate_report_btn.clicked.connect(presenter.on_generate_report, direct)
+        self._reset_btn.clicked.connect(presenter.on_reset, direct)
+        self._import_csv_btn.clicked.connect(presenter.on_import_csv_clicked, direct)
+        self._export_csv_btn.clicked.connect(presenter.on_export_csv_clicked, direct)
 
     def get_test_table_cell_value(self, row: int, column: int) -> str:
         """Get the text value from a test table cell.
@@ -210,16 +286,7 @@ class DegasserTab(BaseTab):
           Cell text value, or empty string if cell doesn't exist
 
         """
-        item = self._test_table.item(row, column)
-        if item is None:
-            return ""
-
-        if column == MEASURED_COL_INDEX:
-            edit_value = item.data(Qt.ItemDataRole.EditRole)
-            if edit_value not in (None, ""):
-                return str(edit_value).strip()
-
-        return item.text().strip()
+        return self._test_model.cell_text(row, column).strip()
 
     def get_time_series_cell_value(self, row: int, column: int) -> float | None:
         """Get the numeric value from a time series table cell.
@@ -235,11 +302,7 @@ class DegasserTab(BaseTab):
           ValueError: If cell text is not a valid number
 
         """
-        item = self._time_series_widget.item(row, column)
-        if item is None:
-            return None
-
-        text = item.text().strip()
+        text = self._time_series_model.cell_text(row, column).strip()
         if not text:
             return None
 
@@ -323,8 +386,8 @@ class DegasserTab(BaseTab):
 
     def question_dialog(self, title: str, text: str) -> bool:
         """Show a question dialog and return the result."""
-        reply = QMessageBox.question(
-            self,
+        reply = self._show_message(
+            QMessageBox.Icon.Question,
             title,
             text,
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
@@ -333,34 +396,62 @@ class DegasserTab(BaseTab):
 
     def info_dialog(self, title: str, text: str) -> bool:
         """Show an info dialog."""
-        reply = QMessageBox.information(
-            self,
-            title,
-            text,
-            QMessageBox.StandardButton.Ok,
-        )
-        return reply == QMessageBox.StandardButton.Ok
+        return self._show_ok_message(QMessageBox.Icon.Information, title, text)
 
     def warning_dialog(self, title: str, text: str) -> bool:
         """Show a warning dialog."""
-        reply = QMessageBox.warning(
-            self,
-            title,
-            text,
-            QMessageBox.StandardButton.Ok,
-        )
-        return reply == QMessageBox.StandardButton.Ok
+        return self._show_ok_message(QMessageBox.Icon.Warning, title, text)
 
     def critical_dialog(self, title: str, text: str) -> bool:
         """Show a critical dialog."""
-        reply = QMessageBox.critical(
-            self,
-            title,
-            text,
-            QMessageBox.StandardButton.Ok,
-        )
+        return self._show_ok_message(QMessageBox.Icon.Critical, title, text)
+
+    def _show_ok_message(self, icon: QMessageBox.Icon, title: str, text: str) -> bool:
+        """Show a message with an Ok button and return whether Ok was clicked."""
+        reply = self._show_message(icon, title, text, QMessageBox.StandardButton.Ok)
         return reply == QMessageBox.StandardButton.Ok
 
+    def _show_message(
+        self,
+        icon: QMessageBox.Icon,
+        title: str,
+        text: str,
+        buttons: QMessageBox.StandardButton,
+    ) -> QMessageBox.StandardButton:
+        """Show a message box modally and return the clicked button.
+
+        Each call gets its own box, so a dialog opened from a worker callback
+        while another one is showing cannot overwrite it.
+
+        Args:
+            icon: Icon shown next to the text
+            title: Window title
+            text: Message text
+            buttons: Standard buttons to offer
+
+        Returns:
+            The standard button the user clicked (Escape maps to No/Ok).
+
+        """
+        box = QMessageBox(self)
+        box.setIcon(icon)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setStandardButtons(buttons)
+        try:
+            return QMessageBox.StandardButton(box.exec())
+        finally:
+            box.deleteLater()
+
+    def set_report_generation_running(self, *, running: bool) -> None:
+        """Disable the Generate Report button while a report is being built."""
+        self._generate_report_btn.setEnabled(not running)
+
+    def set_csv_transfer_running(self, *, running: bool) -> None:
+        """Disable the CSV Import/Export buttons while a transfer is running."""
+        self._import_csv_btn.setEnabled(not running)
+        self._export_csv_btn.setEnabled(not running)
+
     def existing_file_dialog(self, title: str, text: str) -> str:
         """Show an existing file dialog.
 
@@ -427,35 +518,17 @@ class DegasserTab(BaseTab):
         self._date_edit.setDisplayFormat(ISO_8601_DATE_FORMAT)  # ISO 8601 format
         self._serial_edit = QLineEdit()
 
-        # Layout
-        layout.addWidget(
-            QLabel(f"{METADATA_FIELDS['tester_name']}: "),
-            0,
-            0,
-            Qt.AlignmentFlag.AlignRight,
-        )
-        layout.addWidget(self._name_edit, 0, 1)
-        layout.addWidget(
-            QLabel(f"{METADATA_FIELDS['test_date']}: "),
-            0,
-            2,
-            Qt.AlignmentFlag.AlignRight,
-        )
-        layout.addWidget(self._date_edit, 0, 3)
-        layout.addWidget(
-            QLabel(f"{METADATA_FIELDS['ds50_serial_number']}: "),
-            1,
-            0,
-            Qt.AlignmentFlag.AlignRight,
-        )
-        layout.addWidget(self._serial_edit, 1, 1)
-        layout.addWidget(
-            QLabel(f"{METADATA_FIELDS['location']}: "),
-            1,
-            2,
-            Qt.AlignmentFlag.AlignRight,
-        )
-        layout.addWidget(self._location_edit, 1, 3)
+        # Layout: two label/field pairs per grid row
+        for key, field, row, col in (
+            ("tester_name", self._name_edit, 0, 0),
+            ("test_date", self._date_edit, 0, 2),
+            ("ds50_serial_number", self._serial_edit, 1, 0),
+            ("location", self._location_edit, 1, 2),
+        ):
+            layout.addWidget(
+                QLabel(_METADATA_LABELS[key]), row, col, Qt.AlignmentFlag.AlignRight
+            )
+            layout.addWidget(field, row, col + 1)
 
         return widget
 
@@ -465,20 +538,19 @@ class DegasserTab(BaseTab):
         layout = QVBoxLayout()
         widget.setLayout(layout)
 
-        # Create Widgets - use custom widget with column-major tab navigation
-        self._test_table = ColumnMajorTableWidget(NUM_TEST_ROWS, NUM_TEST_COLS)
-        self._test_table.currentCellChanged.connect(
-            self._on_test_table_current_cell_changed
+        # Create Widgets - use custom view with column-major tab navigation
+        self._test_model = TestResultsTableModel(self)
+        self._test_table = ColumnMajorTableView()
+        self._test_table.setModel(self._test_model)
+        # Open the Pass/Fail editor on a single click, like the dropdown it is
+        self._test_table.clicked.connect(
+            self._on_test_table_clicked, Qt.ConnectionType.DirectConnection
         )
-        self._test_table.setHorizontalHeaderLabels(TEST_TABLE_HEADERS)
         self._test_table.setVerticalScrollBarPolicy(
             Qt.ScrollBarPolicy.ScrollBarAlwaysOff
         )  # Disable vertical scrollbar
-
-        units_by_row: dict[int, str] = {}
-        specs_by_row: dict[int, tuple[float | None, float | None]] = {}
-
-        self._populate_test_table_rows(units_by_row, specs_by_row)
+        # Span all columns for the re-circulation header row
+        self._test_table.setSpan(HEADER_ROW_INDEX, 0, 1, NUM_TEST_COLS)
 
         # Configure table headers
         header = self._test_table.horizontalHeader()
@@ -489,6 +561,20 @@ class DegasserTab(BaseTab):
         fixed_height = self._autosize_table(self._test_table)
         self._test_table.setFixedHeight(fixed_height)
 
+        units_by_row: dict[int, str] = {}
+        specs_by_row: dict[int, tuple[float | None, float | None]] = {}
+        for row, spec_key in enumerate(ROW_SPEC_MAPPING):
+            if spec_key is None:
+                continue
+            # Store spec range and units for the validator and display
+            specs_by_row[row] = DS50_SPEC_RANGES.get(spec_key, (None, None))
+            unit = DS50_SPEC_UNITS.get(spec_key, "")
+            if unit:
+                units_by_row[row] = unit
+
+        self._test_table.setItemDelegateForColumn(
+            PASS_FAIL_COL_INDEX, PassFailDelegate(self._test_table)
+        )
         self._test_table.setItemDelegateForColumn(
             MEASURED_COL_INDEX,
             MeasuredValueDelegate(units_by_row, specs_by_row, self._test_table),
@@ -497,94 +583,15 @@ class DegasserTab(BaseTab):
         layout.addWidget(self._test_table)
         return widget
 
-    def _populate_test_table_rows(
-        self,
-        units_by_row: dict[int, str],
-        specs_by_row: dict[int, tuple[float | None, float | None]],
-    ) -> None:
-        """Populate the test table with default rows and specs."""
-        # Pre-fill descriptions (these are read-only)
-        for row, desc in enumerate(DEFAULT_TEST_DESCRIPTIONS):
-            # Column 0: Description only
-            item = QTableWidgetItem(desc)
-            item.setFlags(
-                item.flags() & ~PySide6.QtCore.Qt.ItemFlag.ItemIsEditable
-            )  # Make read-only
-            # Bold and gray background for re-circulation header rows
-            if row == HEADER_ROW_INDEX:
-                font = item.font()
-                font.setPointSize(font.pointSize() + 1)
-                item.setFlags(PySide6.QtCore.Qt.ItemFlag.ItemIsEnabled)
-                item.setFont(font)
-                item.setBackground(HEADER_ROW_COLOR)  # Light gray background
-                # Align text to AlignCenter
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                # Span all columns for 2nd re-circulation header
-                self._test_table.setSpan(HEADER_ROW_INDEX, 0, 1, NUM_TEST_COLS)
-            self._test_table.setItem(row, 0, item)
-
-            # Get spec key for this row (None for header row)
-            spec_key = ROW_SPEC_MAPPING[row]
-
-            # Only add spec cells for non-header rows
-            if spec_key is not None:
-                self._populate_spec_cells(row, spec_key, units_by_row, specs_by_row)
-
-            if row != HEADER_ROW_INDEX:
-                # Column 1: Pass/Fail dropdown for non header rows
-                pass_fail_combo = QComboBox()
-                pass_fail_combo.addItems(["", "Pass", "Fail"])
-                self._test_table.setCellWidget(row, 1, pass_fail_combo)
-
-    def _populate_spec_cells(
-        self,
-        row: int,
-        spec_key: str,
-        units_by_row: dict[int, str],
-        specs_by_row: dict[int, tuple[float | None, float | None]],
-    ) -> None:
-        """Populate spec cells for a given row."""
-        spec = DS50_SPEC_RANGES.get(spec_key, (None, None))
-        unit = DS50_SPEC_UNITS.get(spec_key, "")
-
-        if unit:
-            units_by_row[row] = unit
-
-        # Store spec range for validator
-        specs_by_row[row] = spec
-
-        for col in range(2, NUM_TEST_COLS):
-            if col == SPEC_MIN_COL_INDEX:  # Spec_Min
-                if spec[0] is None:
-                    spec_value = NO_LIMIT_SYMBOL
-                else:
-                    spec_value = f"{spec[0]} {unit}" if unit else str(spec[0])
-            elif col == SPEC_MAX_COL_INDEX:  # Spec_Max
-                if spec[1] is None:
-                    spec_value = NO_LIMIT_SYMBOL
-                else:
-                    spec_value = f"{spec[1]} {unit}" if unit else str(spec[1])
-            else:  # Data Measured (col == 4)
-                spec_value = ""
-
-            spec_item = QTableWidgetItem(spec_value)
-            spec_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            if col in (2, 3):  # Spec columns are read-only
-                spec_item.setFlags(
-                    spec_item.flags() & ~PySide6.QtCore.Qt.ItemFlag.ItemIsEditable
-                )
-            self._test_table.setItem(row, col, spec_item)
-
     def _build_time_series_table(self) -> QWidget:
         """Build just the time series table."""
         widget = QWidget()
         layout = QVBoxLayout()
         widget.setLayout(layout)
 
-        self._time_series_widget = QTableWidget(
-            NUM_TIME_SERIES_ROWS, NUM_TIME_SERIES_COLS
-        )
-        self._time_series_widget.setVerticalHeaderLabels(TIME_SERIES_HEADERS)
+        self._time_series_model = TimeSeriesTableModel(self)
+        self._time_series_widget = QTableView()
+        self._time_series_widget.setModel(self._time_series_model)
         self._time_series_widget.verticalHeader().setVisible(True)
 
         # Hide the horizontal header (column numbers)
@@ -608,19 +615,6 @@ class DegasserTab(BaseTab):
             Qt.ScrollBarPolicy.ScrollBarAlwaysOff
         )
 
-        # Populate table cells
-        for col in range(NUM_TIME_SERIES_COLS):
-            minute_item = QTableWidgetItem(str(col))
-            minute_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            minute_item.setFlags(
-                minute_item.flags() & ~PySide6.QtCore.Qt.ItemFlag.ItemIsEditable
-            )
-            self._time_series_widget.setItem(0, col, minute_item)
-            # Oxygen column - pre-create empty editable cells for alignment purposes
-            oxygen_item = QTableWidgetItem()
-            oxygen_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self._time_series_widget.setItem(1, col, oxygen_item)
-
         # Set fixed height for table
         fixed_height = self._autosize_table(self._time_series_widget)
         self._time_series_widget.setFixedHeight(fixed_height)
@@ -664,18 +658,18 @@ class DegasserTab(BaseTab):
         temp_layout.addStretch()
 
         # Show or hide temperature edit based on checkbox state
-        temp_checkbox.toggled.connect(self._temperature_edit.setVisible)
-        temp_checkbox.toggled.connect(self._temperature_edit.setEnabled)
         temp_checkbox.toggled.connect(
-            lambda checked: self._temperature_edit.setText(
-                str(DEFAULT_TIME_SERIES_TEMP)
-            )
-            if checked
-            else self._temperature_edit.setText("")
+            self._on_temperature_toggled, Qt.ConnectionType.DirectConnection
         )
 
         return temp_layout
 
+    def _on_temperature_toggled(self, checked: bool) -> None:
+        """Show and prefill, or hide and clear, the temperature field."""
+        self._temperature_edit.setVisible(checked)
+        self._temperature_edit.setEnabled(checked)
+        self._temperature_edit.setText(str(DEFAULT_TIME_SERIES_TEMP) if checked else "")
+
     def _build_action_buttons(self) -> QWidget:
         """Build the action buttons section.
 
@@ -717,75 +711,74 @@ class DegasserTab(BaseTab):
         return widget
 
     def _build_console_section(self) -> QWidget:
-        """Build the console section."""
+        """Build the console section.
+
+        The output widget itself is created the first time the console is
+        expanded; until then log_message queues messages in _pending_log.
+        """
         self._console_group_box = QGroupBox("Console Output")
         self._console_group_box.setCheckable(True)
         self._console_group_box.setChecked(False)  # Start collapsed
 
-        layout = QVBoxLayout()
-        self._console_group_box.setLayout(layout)
-
-        # Create Widget
-        self._console_output = QTextBrowser()
-        self._console_output.setReadOnly(True)
-        self._console_output.setMinimumHeight(150)
-
-        layout.addWidget(self._console_output)
+        self._console_layout = QVBoxLayout()
+        self._console_group_box.setLayout(self._console_layout)
+        self._console_output: QPlainTextEdit | None = None
 
         # Connect toggle to hide/show content
-        self._console_group_box.toggled.connect(self._on_console_toggled)
-
-        # Start with content hidden
-        self._console_output.setVisible(False)
+        self._console_group_box.toggled.connect(
+            self._on_console_toggled, Qt.ConnectionType.DirectConnection
+        )
 
         return self._console_group_box
 
+    def _create_console_output(self) -> QPlainTextEdit:
+        """Create the console output widget and add it to the console group."""
+        # Plain text with a block limit: appends stay cheap and the oldest
+        # lines are dropped instead of the log growing without bound
+        console_output = QPlainTextEdit()
+        console_output.setReadOnly(True)
+        console_output.setUndoRedoEnabled(False)
+        console_output.setMaximumBlockCount(CONSOLE_MAX_LINES)
+        console_output.setMinimumHeight(150)
+
+        self._console_layout.addWidget(console_output)
+        return console_output
+
     def _on_console_toggled(self, checked: bool) -> None:
         """Show/hide console output when checkbox is toggled."""
+        if self._console_output is None:
+            if not checked:
+                return
+            self._console_output = self._create_console_output()
+        if checked:
+            self._flush_log()
         self._console_output.setVisible(checked)
 
-    def _on_test_table_current_cell_changed(
-        self, row: int, col: int, old_row: int, old_col: int
-    ) -> None:
-        """Highlight cell widget when cell is selected."""
-        # Reset style of previous cell widget
-        if old_row >= 0 and old_col >= 0:
-            old_widget = self._test_table.cellWidget(old_row, old_col)
-            if isinstance(old_widget, QComboBox):
-                old_widget.setStyleSheet("")
-
-        # Set style of new cell widget
-        if row >= 0 and col >= 0:
-            widget = self._test_table.cellWidget(row, col)
-            if isinstance(widget, QComboBox):
-                # Use a border that contrasts with the dark theme
-                widget.setStyleSheet("border: 2px solid #7AB47A;")
-
-    def _update_test_table(self, test_rows: list[TestResultRow]) -> None:
+    def _flush_log(self) -> None:
+        """Write all queued messages to the console in a single append."""
+        self._log_flush_timer.stop()
+        if self._console_output is None or not self._pending_log:
+            return
+        self._console_output.appendPlainText("\n".join(self._pending_log))
+        self._pending_log.clear()
+
+    def _on_test_table_clicked(self, index: QModelIndex) -> None:
+        """Start editing a Pass/Fail cell as soon as it is clicked."""
+        if index.column() == PASS_FAIL_COL_INDEX:
+            self._test_table.edit(index)
+
+    def _update_test_table(self, test_rows: tuple[TestResultRow, ...]) -> None:
         """Update the test table from state data.
 
         Args:
             test_rows: List of TestResultRow objects to display
 
         """
-        for row_idx, row_data in enumerate(test_rows):
-            # Column 0 (Description) is read-only, set once in __init__
-
-            # Column 1: Pass/Fail dropdown
-            combo = self._test_table.cellWidget(row_idx, 1)
-            if combo:
-                combo = cast("QComboBox", combo)
-                with QSignalBlocker(combo):
-                    if combo.currentText() != row_data.pass_fail:
-                        combo.setCurrentText(row_data.pass_fail)
-
-            # Column 2 & 3 (Spec Min/Max) are static, set once in __init__
-
-            # Column 4: Data Measured
-            self._set_table_cell_float(row_idx, 4, row_data.measured)
+        # Cell text is diffed in the model, which repaints changed cells only
+        self._test_model.update_rows(test_rows)
 
     def _update_time_series_table(
-        self, table_rows: list[tuple[int, float | None]]
+        self, table_rows: tuple[tuple[int, float | None], ...]
     ) -> None:
         """Update the time series table from the state data.
 
@@ -793,86 +786,31 @@ class DegasserTab(BaseTab):
             table_rows: List of (minute, oxygen_level) tuples to display
 
         """
-        for col_idx, (_minute, oxygen_level) in enumerate(table_rows):
-            # Throw away minute variable (not used)
-            _ = _minute
-            # Row 0 (minute labels) is read-only; set once in __init__
-
-            # Row 1: Dissolved O2 measured data (horizontal layout)
-            oxy_item = self._time_series_widget.item(1, col_idx)
-            if oxy_item is None:
-                oxy_item = QTableWidgetItem()
-                oxy_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                self._time_series_widget.setItem(1, col_idx, oxy_item)
-
-            text = f"{oxygen_level:.2f}" if oxygen_level is not None else ""
+        # Row 0 (minute labels) is static; the model diffs the oxygen row and
+        # repaints only the runs of cells that changed
+        self._time_series_model.update_rows(table_rows)
 
-            if oxy_item.text() != text:
-                oxy_item.setText(text)
-
-    def _set_table_cell_float(self, row: int, col: int, value: float | None) -> None:
-        """Set table cell to a float value with row-specific precision.
-
-        Args:
-            row: Row index
-            col: Column index
-            value: Float value to display, or None for empty cell
-
-        """
-        item = self._test_table.item(row, col)
-        if item is None:
-            item = QTableWidgetItem()
-            self._test_table.setItem(row, col, item)
-
-        if value is not None:
-            # Get decimal precision for this row type
-            spec_key = ROW_SPEC_MAPPING[row]
-            precision = DS50_DECIMAL_PRECISION.get(spec_key, 2) if spec_key else 2
-
-            # Format with appropriate precision
-            numeric_text = f"{value:.{precision}f}"
-            if item.text() != numeric_text:
-                item.setText(numeric_text)
-                item.setData(Qt.ItemDataRole.EditRole, numeric_text)
-        elif item.text() != "":
-            item.setText("")
-            item.setData(Qt.ItemDataRole.EditRole, "")
-
-    def _block_signals(self, *, block: bool) -> None:
-        """Block or unblock signals from all input widgets.
+    @contextmanager
+    def _blocked_signals(self, sections: frozenset[str]) -> Generator[None, Any, None]:
+        """Block signals from the input widgets of the given state sections.
 
         Used during programmatic updates to prevent triggering change handlers
-        that would send updates back to the presenter (feedback loop).
+        that would send updates back to the presenter (feedback loop). Widgets
+        of sections that are not being rendered are left alone. Each
+        QSignalBlocker restores its widget's previous blocking state on exit,
+        even if the update raises.
 
         Args:
-            block: True to block signals, False to unblock
+            sections: The state sections about to be rendered
 
         """
-        # Metadata fields
-        self._name_edit.blockSignals(block)
-        self._location_edit.blockSignals(block)
-        self._date_edit.blockSignals(block)
-        self._serial_edit.blockSignals(block)
-
-        # Test Table Fields
-        self._test_table.blockSignals(block)
-        for row in range(NUM_TEST_ROWS):
-            if row == HEADER_ROW_INDEX:
-                continue
-            combo = self._test_table.cellWidget(row, 1)
-            if combo:
-                combo.blockSignals(block)
-
-        # Time Series Fields
-        self._time_series_widget.blockSignals(block)
-        self._temperature_edit.blockSignals(block)
-
-        # Action Buttons
-        self._import_csv_btn.blockSignals(block)
-        self._export_csv_btn.blockSignals(block)
-        self._generate_report_btn.blockSignals(block)
+        with ExitStack() as stack:
+            for section in sections:
+                for widget in self._section_inputs.get(section, ()):
+                    stack.enter_context(QSignalBlocker(widget))
+            yield
 
-    def _autosize_table(self, table: QTableWidget) -> int:
+    def _autosize_table(self, table: QTableView) -> int:
         """Auto-size the test table to fit its contents without scrollbars.
 
         Uses verticalHeader().length() to get the sum of all row heights,
@@ -895,8 +833,15 @@ class DegasserTab(BaseTab):
         )
 
     def log_message(self, message: str) -> None:
-        """Log a message to the console output."""
-        self._console_output.append(message)
+        """Log a message to the console output.
+
+        Messages are queued and written together: at the end of the current
+        event loop pass while the console is open, or when it is expanded
+        while it is collapsed (or not yet created).
+        """
+        self._pending_log.append(message)
+        if self._console_output is not None and self._console_group_box.isChecked():
+            self._log_flush_timer.start()
 
 
 def _main() -> None:
@@ -4,18 +4,23 @@ This module defines the ViewState pattern data structures used to communicate
 between the Presenter and View layers.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import date
 
-from testpad.ui.tabs.degasser_tab.model import TestResultRow
+from testpad.ui.tabs.degasser_tab.model import MODEL_SECTIONS, TestResultRow
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DegasserViewState:
     """Immutable snapshot of all data to display in the degasser view.
 
     This class represents the complete UI state. The Presenter creates instances
-    of this class from the Model, and the View renders them.
+    of this class from the Model, and the View renders them. One is built per
+    refresh, so it uses slots and tuple fields to stay small and comparable.
+
+    `changed_sections` names the model sections (see MODEL_SECTIONS) whose
+    fields differ from what the view last rendered; the view only updates
+    the widgets of those sections. It defaults to every section.
     """
 
     # Metadata Fields
@@ -25,16 +30,17 @@ class DegasserViewState:
     test_date: date | None = None
 
     # Time Series Chart Data
-    time_series_measurements: list[tuple[int, float]] = field(default_factory=list)
+    time_series_measurements: tuple[tuple[int, float], ...] = ()
     temperature_c: float | None = None
 
     # Test Table Data
-    test_rows: list[TestResultRow] = field(default_factory=list)
+    test_rows: tuple[TestResultRow, ...] = ()
 
     # Time Series Table Data
-    time_series_table_rows: list[tuple[int, float | None]] = field(
-        default_factory=list,
-    )
+    time_series_table_rows: tuple[tuple[int, float | None], ...] = ()
 
     # Output Directory
     output_directory: str = ""
+
+    # Model sections to render; the others are already on screen
+    changed_sections: frozenset[str] = frozenset(MODEL_SECTIONS)
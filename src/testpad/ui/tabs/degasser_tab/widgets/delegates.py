@@ -4,9 +4,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QStringListModel, Qt, Slot
 from PySide6.QtGui import QDoubleValidator
-from PySide6.QtWidgets import QStyledItemDelegate, QWidget
+from PySide6.QtWidgets import QComboBox, QStyledItemDelegate, QWidget
 
 if TYPE_CHECKING:
     from PySide6.QtCore import (
@@ -28,6 +28,9 @@ from testpad.ui.tabs.degasser_tab.widgets.table_widgets import (
 )
 from testpad.utils.lineedit_validators import FixupDoubleValidator, ValidatedLineEdit
 
+# Choices offered by the Pass/Fail editor; "" leaves the result unset
+PASS_FAIL_CHOICES = ("", "Pass", "Fail")
+
 
 class MeasuredValueDelegate(ColumnMajorNavigationMixin, QStyledItemDelegate):
     """Delegate that appends units for measured values in the test table."""
@@ -39,8 +42,11 @@ class MeasuredValueDelegate(ColumnMajorNavigationMixin, QStyledItemDelegate):
         parent: QWidget | None = None,
     ) -> None:
         super().__init__(parent)
-        self._units_by_row = units_by_row
         self._specs_by_row = specs_by_row
+        # initStyleOption runs on every paint; build the " unit" suffixes once
+        self._unit_suffixes = {
+            row: f" {unit}" for row, unit in units_by_row.items() if unit
+        }
 
     def initStyleOption(
         self,
@@ -59,15 +65,15 @@ class MeasuredValueDelegate(ColumnMajorNavigationMixin, QStyledItemDelegate):
         if index.column() != MEASURED_COL_INDEX:
             return
 
-        unit = self._units_by_row.get(index.row())
-        if not unit:
+        suffix = self._unit_suffixes.get(index.row())
+        if suffix is None:
             return
 
         # Access text attribute if it exists (not in type stubs but exists at runtime)
         if hasattr(option, "text"):
             text: str = option.text  # type: ignore[attr-defined]
-            if text and not text.endswith(unit):
-                option.text = f"{text} {unit}"  # type: ignore[attr-defined]
+            if text and not text.endswith(suffix):
+                option.text = text + suffix  # type: ignore[attr-defined]
 
     def createEditor(
         self,
@@ -90,8 +96,7 @@ class MeasuredValueDelegate(ColumnMajorNavigationMixin, QStyledItemDelegate):
             index: Model index of the cell being edited
 
         Returns:
-            ValidatedLineEdit widget with event filter installed for
-            column-major navigation
+            ValidatedLineEdit widget configured for the row
 
         """
         _ = option  # Unused
@@ -114,11 +119,8 @@ class MeasuredValueDelegate(ColumnMajorNavigationMixin, QStyledItemDelegate):
         editor.setValidator(validator)
         editor.setPlaceholderText("Enter number")
 
-        # Install event filter for column-major navigation
-        # (This is handled by the mixin, but we do it explicitly here since
-        # we're creating a custom editor rather than calling super().createEditor())
-        editor.installEventFilter(self)
-
+        # The view installs this delegate as the editor's event filter, which
+        # gives the mixin's eventFilter column-major Tab/Enter navigation
         return editor
 
     def setModelData(
@@ -204,3 +206,84 @@ class TimeSeriesValueDelegate(QStyledItemDelegate):
         else:
             # Invalid input - clear the cell
             model.setData(index, "", Qt.ItemDataRole.EditRole)
+
+
+class PassFailDelegate(ColumnMajorNavigationMixin, QStyledItemDelegate):
+    """Delegate editing the Pass/Fail column with a transient combo box.
+
+    The cells themselves hold plain text; a QComboBox exists only while a cell
+    is being edited, instead of one permanent cell widget per row.
+    """
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        # One choice list shared by every editor instead of one item model each
+        self._choices_model = QStringListModel(list(PASS_FAIL_CHOICES), self)
+
+    def createEditor(
+        self,
+        parent: QWidget | None,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> QWidget:
+        """Create a combo box offering the Pass/Fail choices.
+
+        Args:
+            parent: Parent widget for the editor (the table viewport)
+            option: Style options for the editor (unused but required by Qt)
+            index: Model index of the cell being edited (unused)
+
+        Returns:
+            QComboBox that commits as soon as a choice is activated
+
+        """
+        _ = option  # Unused
+        _ = index  # Unused
+        editor = QComboBox(parent)
+        editor.setModel(self._choices_model)
+        editor.activated.connect(self._commit_and_close)
+        return editor
+
+    def setEditorData(
+        self,
+        editor: QWidget,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> None:
+        """Select the cell's current value in the combo box.
+
+        Args:
+            editor: The editor widget (QComboBox)
+            index: Model index of the cell being edited
+
+        """
+        if isinstance(editor, QComboBox):
+            editor.setCurrentText(index.data(Qt.ItemDataRole.EditRole) or "")
+        else:
+            super().setEditorData(editor, index)
+
+    def setModelData(
+        self,
+        editor: QWidget,
+        model: QAbstractItemModel,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> None:
+        """Write the selected choice back to the model.
+
+        Args:
+            editor: The editor widget (QComboBox)
+            model: The model to update
+            index: Model index of the cell being edited
+
+        """
+        if isinstance(editor, QComboBox):
+            model.setData(index, editor.currentText(), Qt.ItemDataRole.EditRole)
+        else:
+            super().setModelData(editor, model, index)
+
+    @Slot()
+    def _commit_and_close(self) -> None:
+        """Commit the activated choice and close its combo box."""
+        editor = self.sender()
+        if isinstance(editor, QComboBox):
+            self.commitData.emit(editor)
+            self.closeEditor.emit(editor)
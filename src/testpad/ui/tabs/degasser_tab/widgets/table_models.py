@@ -0,0 +1,388 @@
+"""Item models backing the Degasser Tab tables."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, override
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
+from PySide6.QtGui import QBrush, QFont
+
+from testpad.ui.tabs.degasser_tab.config import (
+    DEFAULT_TEST_DESCRIPTIONS,
+    DS50_DECIMAL_PRECISION,
+    DS50_SPEC_RANGES,
+    DS50_SPEC_UNITS,
+    HEADER_ROW_COLOR,
+    HEADER_ROW_INDEX,
+    MEASURED_COL_INDEX,
+    MEASURED_OXYGEN_ROW_INDEX,
+    NO_LIMIT_SYMBOL,
+    NUM_TEST_COLS,
+    NUM_TIME_SERIES_COLS,
+    NUM_TIME_SERIES_ROWS,
+    PASS_FAIL_COL_INDEX,
+    ROW_SPEC_MAPPING,
+    SPEC_MAX_COL_INDEX,
+    SPEC_MIN_COL_INDEX,
+    TEST_TABLE_HEADERS,
+    TIME_MINUTES_ROW_INDEX,
+    TIME_SERIES_HEADERS,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from PySide6.QtCore import QObject, QPersistentModelIndex
+
+    from testpad.ui.tabs.degasser_tab.model import TestResultRow
+
+# Bound cell formatters, built once instead of re-parsing a format spec per cell
+_MEASURED_FORMATTERS = tuple(
+    f"{{:.{DS50_DECIMAL_PRECISION.get(spec_key, 2) if spec_key else 2}f}}".format
+    for spec_key in ROW_SPEC_MAPPING
+)
+_format_oxygen = "{:.2f}".format
+
+_DISPLAY_ROLES = (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole)
+
+# data() and flags() run for every painted cell; resolve the enums once
+_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+_NO_FLAGS = Qt.ItemFlag.NoItemFlags
+_HEADER_FLAGS = Qt.ItemFlag.ItemIsEnabled
+_READ_ONLY_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+_EDITABLE_FLAGS = _READ_ONLY_FLAGS | Qt.ItemFlag.ItemIsEditable
+_EDITABLE_TEST_COLUMNS = (PASS_FAIL_COL_INDEX, MEASURED_COL_INDEX)
+
+# Invalid index standing in for the (absent) parent of every table cell
+_ROOT_INDEX = QModelIndex()
+
+
+def _spec_limit_text(limit: float | None, unit: str) -> str:
+    """Format a spec limit for display, or the no-limit symbol if unbounded."""
+    if limit is None:
+        return NO_LIMIT_SYMBOL
+    return f"{limit} {unit}" if unit else str(limit)
+
+
+def _spec_cell_texts(spec_key: str | None) -> tuple[str, str]:
+    """Return the (min, max) spec cell texts for a test row's spec key."""
+    if spec_key is None:
+        return "", ""
+    spec_min, spec_max = DS50_SPEC_RANGES.get(spec_key, (None, None))
+    unit = DS50_SPEC_UNITS.get(spec_key, "")
+    return _spec_limit_text(spec_min, unit), _spec_limit_text(spec_max, unit)
+
+
+# Spec limits are static config, so their cell texts are built once per row
+_SPEC_CELL_TEXTS = tuple(_spec_cell_texts(spec_key) for spec_key in ROW_SPEC_MAPPING)
+# Likewise the descriptions and the time-series minute labels, shared by every
+# model instance
+_TEST_DESCRIPTIONS = tuple(DEFAULT_TEST_DESCRIPTIONS)
+_MINUTE_TEXTS = tuple(str(minute) for minute in range(NUM_TIME_SERIES_COLS))
+
+
+class TestResultsTableModel(QAbstractTableModel):
+    """Table model for the DS-50 test results table.
+
+    Holds the cell text column-wise: descriptions and spec limits are static,
+    while Pass/Fail and measured text are refreshed from the presenter's view
+    state through update_rows(). Only cells whose text changed are reported to
+    the view, so a refresh repaints just those cells.
+
+    Signals:
+        cell_edited: Emitted with (row, column) after the user edits a cell.
+            Not emitted for programmatic updates through update_rows().
+    """
+
+    cell_edited = Signal(int, int)
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._descriptions = _TEST_DESCRIPTIONS
+        self._pass_fail = [""] * len(self._descriptions)
+        self._measured_text = [""] * len(self._descriptions)
+
+        # Header row styling, shared by every data() call for that row
+        header_font = QFont()
+        header_font.setPointSize(header_font.pointSize() + 1)
+        self._header_style: dict[int, Any] = {
+            Qt.ItemDataRole.BackgroundRole: QBrush(HEADER_ROW_COLOR),
+            Qt.ItemDataRole.FontRole: header_font,
+        }
+
+    @override
+    def rowCount(
+        self, parent: QModelIndex | QPersistentModelIndex = _ROOT_INDEX
+    ) -> int:
+        return 0 if parent.isValid() else len(self._descriptions)
+
+    @override
+    def columnCount(
+        self, parent: QModelIndex | QPersistentModelIndex = _ROOT_INDEX
+    ) -> int:
+        return 0 if parent.isValid() else NUM_TEST_COLS
+
+    @override
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return TEST_TABLE_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    @override
+    def data(
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if not index.isValid():
+            return None
+        row = index.row()
+        column = index.column()
+
+        if role in _DISPLAY_ROLES:
+            return self._cell_text(row, column)
+        if role == _ALIGNMENT_ROLE:
+            # Descriptions stay left-aligned, except the spanned header row
+            if column != 0 or row == HEADER_ROW_INDEX:
+                return _ALIGN_CENTER
+            return None
+        if row == HEADER_ROW_INDEX:
+            return self._header_style.get(role)
+        return None
+
+    @override
+    def flags(self, index: QModelIndex | QPersistentModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return _NO_FLAGS
+        if index.row() == HEADER_ROW_INDEX:
+            return _HEADER_FLAGS
+        if index.column() in _EDITABLE_TEST_COLUMNS:
+            return _EDITABLE_FLAGS
+        return _READ_ONLY_FLAGS
+
+    @override
+    def setData(
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        value: Any,
+        role: int = Qt.ItemDataRole.EditRole,
+    ) -> bool:
+        """Store user input for an editable column and announce the edit."""
+        column = index.column()
+        if (
+            role != Qt.ItemDataRole.EditRole
+            or not index.isValid()
+            or column not in _EDITABLE_TEST_COLUMNS
+            or index.row() == HEADER_ROW_INDEX
+        ):
+            return False
+
+        row = index.row()
+        cells = (
+            self._pass_fail if column == PASS_FAIL_COL_INDEX else self._measured_text
+        )
+        text = "" if value is None else str(value).strip()
+        if cells[row] == text:
+            return True
+        cells[row] = text
+        self.dataChanged.emit(index, index, list(_DISPLAY_ROLES))
+        self.cell_edited.emit(row, column)
+        return True
+
+    def cell_text(self, row: int, column: int) -> str:
+        """Return the text shown in a cell, or "" if it is out of range."""
+        if not (0 <= row < len(self._descriptions) and 0 <= column < NUM_TEST_COLS):
+            return ""
+        return self._cell_text(row, column)
+
+    def update_rows(self, test_rows: Sequence[TestResultRow]) -> None:
+        """Refresh Pass/Fail and measured text from the model's test rows.
+
+        Emits a single dataChanged covering only the rows whose text changed;
+        nothing is emitted when the table is already up to date.
+
+        Args:
+            test_rows: Test rows in table order
+
+        """
+        first_changed = last_changed = -1
+        for row, row_data in enumerate(test_rows):
+            if row == HEADER_ROW_INDEX:
+                # Spanned header row has no Pass/Fail or measured cells
+                continue
+            measured_text = (
+                _MEASURED_FORMATTERS[row](row_data.measured)
+                if row_data.measured is not None
+                else ""
+            )
+            if (
+                self._pass_fail[row] == row_data.pass_fail
+                and self._measured_text[row] == measured_text
+            ):
+                continue
+            self._pass_fail[row] = row_data.pass_fail
+            self._measured_text[row] = measured_text
+            if first_changed < 0:
+                first_changed = row
+            last_changed = row
+
+        if first_changed >= 0:
+            self.dataChanged.emit(
+                self.index(first_changed, PASS_FAIL_COL_INDEX),
+                self.index(last_changed, MEASURED_COL_INDEX),
+                list(_DISPLAY_ROLES),
+            )
+
+    def _cell_text(self, row: int, column: int) -> str:
+        """Return the text of a cell within the table bounds."""
+        if column == 0:
+            return self._descriptions[row]
+        if column == PASS_FAIL_COL_INDEX:
+            return self._pass_fail[row]
+        if column == SPEC_MIN_COL_INDEX:
+            return _SPEC_CELL_TEXTS[row][0]
+        if column == SPEC_MAX_COL_INDEX:
+            return _SPEC_CELL_TEXTS[row][1]
+        return self._measured_text[row]
+
+
+class TimeSeriesTableModel(QAbstractTableModel):
+    """Table model for the horizontal dissolved oxygen time series table.
+
+    Row 0 holds the read-only minute labels and row 1 the editable oxygen
+    levels, one column per minute. update_rows() diffs the incoming levels
+    against the displayed text and emits one dataChanged per contiguous run of
+    changed columns.
+
+    Signals:
+        cell_edited: Emitted with (row, column) after the user edits a cell.
+            Not emitted for programmatic updates through update_rows().
+    """
+
+    cell_edited = Signal(int, int)
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._minute_text = _MINUTE_TEXTS
+        self._oxygen_text = [""] * NUM_TIME_SERIES_COLS
+
+    @override
+    def rowCount(
+        self, parent: QModelIndex | QPersistentModelIndex = _ROOT_INDEX
+    ) -> int:
+        return 0 if parent.isValid() else NUM_TIME_SERIES_ROWS
+
+    @override
+    def columnCount(
+        self, parent: QModelIndex | QPersistentModelIndex = _ROOT_INDEX
+    ) -> int:
+        return 0 if parent.isValid() else NUM_TIME_SERIES_COLS
+
+    @override
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if (
+            orientation == Qt.Orientation.Vertical
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return TIME_SERIES_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    @override
+    def data(
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if not index.isValid():
+            return None
+        if role in _DISPLAY_ROLES:
+            return self._cell_text(index.row(), index.column())
+        if role == _ALIGNMENT_ROLE:
+            return _ALIGN_CENTER
+        return None
+
+    @override
+    def flags(self, index: QModelIndex | QPersistentModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return _NO_FLAGS
+        if index.row() == MEASURED_OXYGEN_ROW_INDEX:
+            return _EDITABLE_FLAGS
+        return _READ_ONLY_FLAGS
+
+    @override
+    def setData(
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        value: Any,
+        role: int = Qt.ItemDataRole.EditRole,
+    ) -> bool:
+        """Store user input for an oxygen cell and announce the edit."""
+        if (
+            role != Qt.ItemDataRole.EditRole
+            or not index.isValid()
+            or index.row() != MEASURED_OXYGEN_ROW_INDEX
+        ):
+            return False
+
+        column = index.column()
+        text = "" if value is None else str(value).strip()
+        if self._oxygen_text[column] == text:
+            return True
+        self._oxygen_text[column] = text
+        self.dataChanged.emit(index, index, list(_DISPLAY_ROLES))
+        self.cell_edited.emit(MEASURED_OXYGEN_ROW_INDEX, column)
+        return True
+
+    def cell_text(self, row: int, column: int) -> str:
+        """Return the text shown in a cell, or "" if it is out of range."""
+        if not (0 <= row < NUM_TIME_SERIES_ROWS and 0 <= column < NUM_TIME_SERIES_COLS):
+            return ""
+        return self._cell_text(row, column)
+
+    def update_rows(self, table_rows: Sequence[tuple[int, float | None]]) -> None:
+        """Refresh the oxygen row from (minute, oxygen_level) pairs.
+
+        Args:
+            table_rows: One (minute, oxygen_level) pair per table column
+
+        """
+        run_start = -1
+        for column, (_minute, oxygen_level) in enumerate(table_rows):
+            text = _format_oxygen(oxygen_level) if oxygen_level is not None else ""
+            if self._oxygen_text[column] != text:
+                self._oxygen_text[column] = text
+                if run_start < 0:
+                    run_start = column
+            elif run_start >= 0:
+                self._emit_oxygen_changed(run_start, column - 1)
+                run_start = -1
+        if run_start >= 0:
+            self._emit_oxygen_changed(run_start, len(table_rows) - 1)
+
+    def _emit_oxygen_changed(self, first_column: int, last_column: int) -> None:
+        """Report a contiguous run of changed oxygen cells to the view."""
+        self.dataChanged.emit(
+            self.index(MEASURED_OXYGEN_ROW_INDEX, first_column),
+            self.index(MEASURED_OXYGEN_ROW_INDEX, last_column),
+            list(_DISPLAY_ROLES),
+        )
+
+    def _cell_text(self, row: int, column: int) -> str:
+        """Return the text of a cell within the table bounds."""
+        if row == TIME_MINUTES_ROW_INDEX:
+            return self._minute_text[column]
+        return self._oxygen_text[column]
@@ -4,19 +4,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, override
 
-import PySide6.QtCore
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QTableWidget, QWidget
+from PySide6.QtCore import QEvent, Qt
+from PySide6.QtWidgets import QTableView
 
 if TYPE_CHECKING:
-    from PySide6.QtCore import (
-        QEvent,
-        QModelIndex,
-        QObject,
-        QPersistentModelIndex,
-    )
+    from PySide6.QtCore import QObject
     from PySide6.QtGui import QKeyEvent
-    from PySide6.QtWidgets import QStyleOptionViewItem
 
 from testpad.ui.tabs.degasser_tab.config import (
     HEADER_ROW_INDEX,
@@ -24,14 +17,39 @@ from testpad.ui.tabs.degasser_tab.config import (
     PASS_FAIL_COL_INDEX,
 )
 
+# Looked up once per editor event in ColumnMajorNavigationMixin.eventFilter
+_KEY_PRESS = QEvent.Type.KeyPress
+_NAV_KEYS = frozenset(
+    {Qt.Key.Key_Tab, Qt.Key.Key_Backtab, Qt.Key.Key_Return, Qt.Key.Key_Enter}
+)
+
 
-class ColumnMajorTableWidget(QTableWidget):
-    """QTableWidget with column-major tab navigation (top→bottom, left→right).
+class ColumnMajorTableView(QTableView):
+    """QTableView with column-major tab navigation (top→bottom, left→right).
 
     Overrides default Qt behavior where Tab moves left→right across columns.
     Instead, Tab moves top→bottom within a column, then wraps to the next column.
     """
 
+    # Moves from every navigable cell, keyed by (row, col, forward); rebuilt by
+    # _lookup_next_cell() whenever the row count differs from _nav_rows
+    _nav_moves: dict[tuple[int, int, bool], tuple[int, int]] | None = None
+    _nav_rows = -1
+
+    def _row_count(self) -> int:
+        """Return the number of rows in the view's model."""
+        model = self.model()
+        return model.rowCount() if model is not None else 0
+
+    def _current_cell(self) -> tuple[int, int]:
+        """Return the (row, column) of the current cell."""
+        index = self.currentIndex()
+        return index.row(), index.column()
+
+    def _set_current_cell(self, row: int, col: int) -> None:
+        """Make the given cell the current cell."""
+        self.setCurrentIndex(self.model().index(row, col))
+
     def _get_next_cell(
         self, row: int, col: int, *, forward: bool = True
     ) -> tuple[int, int]:
@@ -55,9 +73,31 @@ class ColumnMajorTableWidget(QTableWidget):
             return self._get_next_cell_forward(row, col)
         return self._get_next_cell_backward(row, col)
 
+    def _lookup_next_cell(
+        self, row: int, col: int, *, forward: bool
+    ) -> tuple[int, int]:
+        """Return the next cell from the precomputed move table.
+
+        The table covers the Pass/Fail and Measured columns, the only cells
+        navigation lands on. Other starting cells fall back to _get_next_cell.
+        """
+        rows = self._row_count()
+        if self._nav_moves is None or rows != self._nav_rows:
+            self._nav_moves = {
+                (r, c, fwd): self._get_next_cell(r, c, forward=fwd)
+                for r in range(rows)
+                for c in (PASS_FAIL_COL_INDEX, MEASURED_COL_INDEX)
+                for fwd in (True, False)
+            }
+            self._nav_rows = rows
+        move = self._nav_moves.get((row, col, forward))
+        if move is None:
+            return self._get_next_cell(row, col, forward=forward)
+        return move
+
     def _get_next_cell_forward(self, row: int, col: int) -> tuple[int, int]:
         """Calculate next cell position moving forward."""
-        rows = self.rowCount()
+        rows = self._row_count()
         new_row, new_col = row, col
 
         # If not in target column, jump to first target column (Pass/Fail)
@@ -92,7 +132,7 @@ class ColumnMajorTableWidget(QTableWidget):
 
     def _get_next_cell_backward(self, row: int, col: int) -> tuple[int, int]:
         """Calculate next cell position moving backward."""
-        rows = self.rowCount()
+        rows = self._row_count()
         new_row, new_col = row, col
 
         # If not in target column, jump to last target column (Measured)
@@ -127,7 +167,7 @@ class ColumnMajorTableWidget(QTableWidget):
     def keyPressEvent(self, event: QKeyEvent) -> None:
         """Override Qt's default key handling to implement column-major navigation.
 
-        By default, QTableWidget uses row-major Tab navigation (left→right).
+        By default, QTableView uses row-major Tab navigation (left→right).
         This override intercepts Tab/Enter/Backtab keys and implements column-major
         navigation instead. Other keys are passed to Qt's default handler.
         """
@@ -136,21 +176,19 @@ class ColumnMajorTableWidget(QTableWidget):
         if key in (Qt.Key.Key_Tab, Qt.Key.Key_Return, Qt.Key.Key_Enter):
             # Tab and Enter both move forward in column-major order
             event.accept()  # Prevent Qt's default row-major navigation
-            new_row, new_col = self._get_next_cell(
-                self.currentRow(),
-                self.currentColumn(),
+            new_row, new_col = self._lookup_next_cell(
+                *self._current_cell(),
                 forward=True,
             )
-            self.setCurrentCell(new_row, new_col)
+            self._set_current_cell(new_row, new_col)
         elif key == Qt.Key.Key_Backtab:
             # Shift+Tab moves backward in column-major order
             event.accept()  # Prevent Qt's default behavior
-            new_row, new_col = self._get_next_cell(
-                self.currentRow(),
-                self.currentColumn(),
+            new_row, new_col = self._lookup_next_cell(
+                *self._current_cell(),
                 forward=False,
             )
-            self.setCurrentCell(new_row, new_col)
+            self._set_current_cell(new_row, new_col)
         else:
             # For all other keys (arrows, letters, etc.), use Qt's default handling
             super().keyPressEvent(event)
@@ -159,10 +197,11 @@ class ColumnMajorTableWidget(QTableWidget):
 class ColumnMajorNavigationMixin:
     """Mixin for item delegates to support column-major navigation during cell editing.
 
-    This mixin installs an event filter on editor widgets to intercept Tab/Enter
-    keys and forward them to the table's navigation logic. Any delegate class that
-    inherits from this mixin will automatically support column-major navigation during
-    editing.
+    Item views install their delegate as an event filter on every editor they
+    open, so overriding eventFilter is enough to intercept Tab/Enter keys and
+    forward them to the table's navigation logic. Any delegate class that
+    inherits from this mixin will automatically support column-major navigation
+    during editing.
 
     Usage: class MyDelegate(ColumnMajorNavigationMixin, QStyledItemDelegate): ...
     Note: Mixin must come BEFORE QStyledItemDelegate in the inheritance list
@@ -174,7 +213,9 @@ class ColumnMajorNavigationMixin:
         """Intercept key events from editor widgets and redirect navigation keys.
 
         When we detect Tab/Enter, we bypass the editor and send the event directly
-        to the table's keyPressEvent for custom handling.
+        to the table's keyPressEvent for custom handling. This runs for every
+        event the editor receives, so anything but a key press is handed straight
+        to Qt's filter.
 
         Args:
             watched: The object being watched (the editor widget)
@@ -185,46 +226,12 @@ class ColumnMajorNavigationMixin:
             False to allow normal event propagation
 
         """
-        if event.type() == PySide6.QtCore.QEvent.Type.KeyPress:
-            # Cast to QKeyEvent to access key()
-            key_event: QKeyEvent = event  # type: ignore[assignment]
-            if key_event.key() in (
-                Qt.Key.Key_Tab,
-                Qt.Key.Key_Backtab,
-                Qt.Key.Key_Return,
-                Qt.Key.Key_Enter,
-            ):
-                # This is a navigation key - don't let the editor process it
-                table = self.parent()  # type: ignore[attr-defined]  # Delegate's parent is the table widget
-                if isinstance(table, ColumnMajorTableWidget):
-                    # Forward the event to the table's custom navigation handler
-                    table.keyPressEvent(key_event)
-                    return True  # Event handled, stop propagation
+        if event.type() == _KEY_PRESS and event.key() in _NAV_KEYS:  # type: ignore[attr-defined]
+            # This is a navigation key - don't let the editor process it
+            table = self.parent()  # type: ignore[attr-defined]  # Delegate's parent is the table
+            if isinstance(table, ColumnMajorTableView):
+                # Forward the event to the table's custom navigation handler
+                table.keyPressEvent(event)  # type: ignore[arg-type]
+                return True  # Event handled, stop propagation
         # Not a navigation key, or not our custom table - use default behavior
         return super().eventFilter(watched, event)  # type: ignore[misc]
-
-    def createEditor(
-        self,
-        parent: QWidget | None,
-        option: QStyleOptionViewItem,
-        index: QModelIndex | QPersistentModelIndex,
-    ) -> QWidget:
-        """Create editor widget and install this delegate as an event filter.
-
-        Qt calls this method when a cell begins editing.
-
-        Args:
-            parent: Parent widget for the editor (the table viewport)
-            option: Style options for the editor
-            index: Model index of the cell being edited
-
-        Returns:
-            The editor widget with event filter installed
-
-        """
-        editor = super().createEditor(parent, option, index)  # type: ignore[misc]
-        if editor:
-            # Install this delegate as an event filter on the editor
-            # Now our eventFilter() method will intercept the editor's key events
-            editor.installEventFilter(self)  # type: ignore[attr-defined]
-        return editor
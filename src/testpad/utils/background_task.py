@@ -0,0 +1,64 @@
+"""Run blocking work on Qt's global thread pool.
+
+Results and errors are delivered back on the thread that started the task
+(normally the GUI thread) through queued signals, so callbacks may safely
+touch widgets and models.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, Signal
+
+
+class BackgroundTaskSignals(QObject):
+    """Signals emitted by a BackgroundTask."""
+
+    succeeded = Signal(object)
+    failed = Signal(Exception)
+
+
+class BackgroundTask(QRunnable):
+    """QRunnable wrapping a plain callable.
+
+    The callable must not touch Qt widgets; it only computes or performs I/O.
+    """
+
+    def __init__(self, fn: Callable[[], Any]) -> None:
+        super().__init__()
+        self._fn = fn
+        self.signals = BackgroundTaskSignals()
+
+    def run(self) -> None:
+        """Execute the callable and report its outcome."""
+        try:
+            result = self._fn()
+        except Exception as e:  # noqa: BLE001 - forwarded to the caller
+            self.signals.failed.emit(e)
+        else:
+            self.signals.succeeded.emit(result)
+
+
+def run_in_background(
+    fn: Callable[[], Any],
+    on_success: Callable[[Any], None],
+    on_error: Callable[[Exception], None],
+) -> BackgroundTask:
+    """Start `fn` on the global thread pool.
+
+    Args:
+        fn: Blocking callable to execute off the calling thread.
+        on_success: Called with the return value of `fn`.
+        on_error: Called with the exception raised by `fn`.
+
+    Returns:
+        The started task. Callers must keep a reference until one of the
+        callbacks has run, otherwise its signals may be garbage collected.
+
+    """
+    task = BackgroundTask(fn)
+    # Queued so callbacks run on the connecting (GUI) thread, not the worker
+    task.signals.succeeded.connect(on_success, Qt.ConnectionType.QueuedConnection)
+    task.signals.failed.connect(on_error, Qt.ConnectionType.QueuedConnection)
+    QThreadPool.globalInstance().start(task)
+    return task
@@ -23,7 +23,14 @@ from testpad.ui.tabs.degasser_tab.config import (
     NUM_TIME_SERIES_COLS,
     START_MINUTE,
 )
-from testpad.ui.tabs.degasser_tab.model import DegasserModel
+from testpad.ui.tabs.degasser_tab.model import (
+    MEASUREMENTS_SECTION,
+    METADATA_SECTION,
+    MODEL_SECTIONS,
+    TEMPERATURE_SECTION,
+    TEST_ROWS_SECTION,
+    DegasserModel,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -302,6 +309,17 @@ class TestCSVImport:
 
         assert model.get_temperature_c() == 25.5
 
+    def test_load_csv_with_crlf_line_endings(self, tmp_path: Path) -> None:
+        """CSV written with Windows line endings should load the same values."""
+        csv_file = tmp_path / "test_data.csv"
+        csv_file.write_bytes(b"time,oxygen_mg_per_L,temp_c\r\n0,5.0,21.0\r\n1,7.5,\r\n")
+
+        model = DegasserModel()
+        model.load_from_csv(str(csv_file))
+
+        assert model.list_measurements() == [(0, 5.0), (1, 7.5)]
+        assert model.get_temperature_c() == 21.0
+
     def test_load_csv_missing_required_columns(self, tmp_path: Path) -> None:
         """CSV with missing required columns should raise ValueError."""
         csv_file = tmp_path / "test_data.csv"
@@ -334,6 +352,31 @@ class TestCSVImport:
         with pytest.raises(ValueError, match="must be > 0"):
             model.load_from_csv(str(csv_file))
 
+    def test_failed_load_keeps_existing_data(self, tmp_path: Path) -> None:
+        """A CSV that fails validation should leave the current readings intact."""
+        csv_file = tmp_path / "test_data.csv"
+        csv_file.write_text("time,oxygen_mg_per_L\n0,5.0\n1,0.0\n")
+
+        model = DegasserModel()
+        model.set_measurement(3, 6.0)
+        with pytest.raises(ValueError, match="must be > 0"):
+            model.load_from_csv(str(csv_file))
+
+        assert model.list_measurements() == [(3, 6.0)]
+
+    def test_read_csv_does_not_touch_model(self, tmp_path: Path) -> None:
+        """Parsing should be side-effect free until the result is applied."""
+        csv_file = tmp_path / "test_data.csv"
+        csv_file.write_text("time,oxygen_mg_per_L,temp\n0,5.0,22.0\n1,4.0,22.0\n")
+
+        model = DegasserModel()
+        imported = DegasserModel.read_csv(str(csv_file))
+        assert model.list_measurements() == []
+
+        model.apply_csv_import(imported)
+        assert model.list_measurements() == [(0, 5.0), (1, 4.0)]
+        assert model.get_temperature_c() == 22.0
+
 
 class TestCSVExport:
     """Test CSV export."""
@@ -404,6 +447,25 @@ class TestTableTests:
         with pytest.raises(ValueError, match="out of range"):
             model.update_test_row(99, pass_fail="Fail")
 
+    def test_update_test_rows_batch(self) -> None:
+        """A batch update should apply every row and bump the revision once."""
+        model = DegasserModel()
+        model.update_test_rows([(0, {"measured": -25.0}), (1, {"pass_fail": "Fail"})])
+
+        rows = model.get_test_rows()
+        assert rows[0].pass_fail == "Pass"
+        assert rows[1].pass_fail == "Fail"
+        assert model.get_revision(TEST_ROWS_SECTION) == 1
+
+    def test_update_test_rows_reports_rejected_updates(self) -> None:
+        """Rejected updates should be reported without dropping valid ones."""
+        model = DegasserModel()
+        with pytest.raises(ValueError, match="row 99"):
+            model.update_test_rows([(99, {"measured": 1.0}), (2, {"measured": 6.0})])
+
+        assert model.get_test_rows()[2].measured == 6.0
+        assert model.get_revision(TEST_ROWS_SECTION) == 1
+
     def test_auto_pass_fail_validation_within_spec(self) -> None:
         """Measured value within spec range should auto-set Pass/Fail to 'Pass'."""
         model = DegasserModel()
@@ -501,6 +563,21 @@ class TestMetadataHandling:
         assert metadata.tester_name == "Alice"
         assert metadata.ds50_serial == "DS50-1234"
 
+    def test_typed_metadata_setters(self) -> None:
+        """Typed setters should update their field and bump the metadata revision."""
+        model = DegasserModel()
+        model.set_tester_name("Bob")
+        model.set_location("Toronto")
+        model.set_ds50_serial("#42")
+        model.set_test_date(date(2025, 1, 2))
+
+        metadata = model.get_metadata()
+        assert metadata.tester_name == "Bob"
+        assert metadata.location == "Toronto"
+        assert metadata.ds50_serial == "#42"
+        assert metadata.test_date == date(2025, 1, 2)
+        assert model.get_revision(METADATA_SECTION) == 4
+
     def test_set_invalid_metadata_field(self) -> None:
         """Set a metadata field with an invalid name should raise ValueError."""
         model = DegasserModel()
@@ -513,3 +590,65 @@ class TestMetadataHandling:
         metadata = model.get_metadata()
         assert metadata.test_date is not None
         assert isinstance(metadata.test_date, date)
+
+
+# ====================================================================================
+# REVISION TESTS
+# ====================================================================================
+class TestRevisionTracking:
+    """Test the per-section revision counters used for presenter caching."""
+
+    def test_mutators_bump_only_their_section(self) -> None:
+        """Each mutator should bump its own section and leave others untouched."""
+        model = DegasserModel()
+        model.set_measurement(2, 6.0)
+        assert model.get_revision(MEASUREMENTS_SECTION) == 1
+        assert model.get_revision(TEMPERATURE_SECTION) == 0
+
+        model.set_temperature(21.5)
+        model.set_metadata_field("location", "Lab")
+        model.update_test_row(0, measured=-25)
+        assert model.get_revision(TEMPERATURE_SECTION) == 1
+        assert model.get_revision(METADATA_SECTION) == 1
+        assert model.get_revision(TEST_ROWS_SECTION) == 1
+        assert model.get_revision(MEASUREMENTS_SECTION) == 1
+
+    def test_clearing_missing_measurement_keeps_revision(self) -> None:
+        """Clearing an empty minute is a no-op and should not invalidate caches."""
+        model = DegasserModel()
+        model.clear_measurement(4)
+        assert model.get_revision(MEASUREMENTS_SECTION) == 0
+
+    def test_unchanged_values_keep_revision(self) -> None:
+        """Re-setting the stored value should not invalidate caches."""
+        model = DegasserModel()
+        model.set_temperature("21")
+        model.set_temperature("21.0")
+        model.set_tester_name("")
+        model.clear_temperature()
+        model.clear_temperature()
+        assert model.get_revision(TEMPERATURE_SECTION) == 2
+        assert model.get_revision(METADATA_SECTION) == 0
+
+    def test_reset_bumps_every_section(self) -> None:
+        """Reset should invalidate all sections."""
+        model = DegasserModel()
+        model.reset()
+        for section in MODEL_SECTIONS:
+            assert model.get_revision(section) == 1
+
+    def test_version_tracks_any_section_change(self) -> None:
+        """The model version should advance with every section mutation."""
+        model = DegasserModel()
+        assert model.get_version() == 0
+        model.set_measurement(1, 7.0)
+        model.set_temperature(20.0)
+        assert model.get_version() == 2
+        model.clear_measurement(9)
+        assert model.get_version() == 2
+
+    def test_unknown_section_rejected(self) -> None:
+        """Asking for an unknown section should raise ValueError."""
+        model = DegasserModel()
+        with pytest.raises(ValueError, match="Unknown model section"):
+            model.get_revision("bogus")
@@ -4,10 +4,20 @@ import sys
 from typing import cast
 
 import pytest
+from PySide6.QtCore import QEvent, Qt
+from PySide6.QtGui import QKeyEvent
 from PySide6.QtWidgets import QApplication
 
-from testpad.ui.tabs.degasser_tab.config import HEADER_ROW_INDEX
-from testpad.ui.tabs.degasser_tab.view import ColumnMajorTableWidget
+from testpad.ui.tabs.degasser_tab.config import (
+    HEADER_ROW_INDEX,
+    MEASURED_COL_INDEX,
+    NUM_TIME_SERIES_COLS,
+    PASS_FAIL_COL_INDEX,
+)
+from testpad.ui.tabs.degasser_tab.widgets import table_models
+from testpad.ui.tabs.degasser_tab.widgets.delegates import MeasuredValueDelegate
+from testpad.ui.tabs.degasser_tab.widgets.table_models import TimeSeriesTableModel
+from testpad.ui.tabs.degasser_tab.widgets.table_widgets import ColumnMajorTableView
 
 
 # Check if QApplication already exists to avoid
@@ -21,85 +31,204 @@ def qapp() -> QApplication:
     return cast("QApplication", app)
 
 
-class TestColumnMajorTableWidget:
-    """Tests for the custom table widget navigation logic."""
+class TestColumnMajorTableView:
+    """Tests for the custom table view navigation logic."""
 
     @pytest.fixture
-    def table(self) -> ColumnMajorTableWidget:
-        """Create a 7x5 table for testing."""
-        return ColumnMajorTableWidget(7, 5)
+    def table(self, qapp: QApplication) -> ColumnMajorTableView:
+        """Create a view over the 7x5 test results model for testing."""
+        _ = qapp
+        table = ColumnMajorTableView()
+        # Via the module, so pytest does not try to collect the Test* class
+        table.setModel(table_models.TestResultsTableModel(table))
+        return table
 
-    def test_navigation_forward_simple(self, table: ColumnMajorTableWidget) -> None:
+    def test_navigation_forward_simple(self, table: ColumnMajorTableView) -> None:
         """Tab/Enter should move down within a column."""
-        # Start at (0,0)
-        # HEADER_ROW_INDEX is usually 3.
-        # (0,0) -> (1,0)
+        # (0,PF) -> (1,PF)
         next_row, next_col = table._get_next_cell(  # noqa: SLF001
-            0, 0, forward=True
+            0, PASS_FAIL_COL_INDEX, forward=True
         )
-        assert (next_row, next_col) == (1, 0)
+        assert (next_row, next_col) == (1, PASS_FAIL_COL_INDEX)
 
-    def test_navigation_skip_header_forward(
-        self, table: ColumnMajorTableWidget
-    ) -> None:
+    def test_navigation_skip_header_forward(self, table: ColumnMajorTableView) -> None:
         """Navigation should skip the header row moving forward."""
-        # Assuming HEADER_ROW_INDEX is 3
         # Row 2 -> Row 4 (Skip 3)
         next_row, next_col = table._get_next_cell(  # noqa: SLF001
-            HEADER_ROW_INDEX - 1, 0, forward=True
+            HEADER_ROW_INDEX - 1, PASS_FAIL_COL_INDEX, forward=True
         )
         assert next_row == HEADER_ROW_INDEX + 1
-        assert next_col == 0
+        assert next_col == PASS_FAIL_COL_INDEX
 
-    def test_navigation_column_wrap_forward(
-        self, table: ColumnMajorTableWidget
-    ) -> None:
-        """At bottom of column, wrap to top of next column."""
-        rows = table.rowCount()
-        # Bottom of col 0 -> Top of col 1
+    def test_navigation_column_wrap_forward(self, table: ColumnMajorTableView) -> None:
+        """At bottom of Pass/Fail, wrap to top of Measured."""
+        rows = table.model().rowCount()
         next_row, next_col = table._get_next_cell(  # noqa: SLF001
-            rows - 1, 0, forward=True
+            rows - 1, PASS_FAIL_COL_INDEX, forward=True
         )
         assert next_row == 0
-        assert next_col == 1
+        assert next_col == MEASURED_COL_INDEX
 
-    def test_navigation_table_wrap_forward(self, table: ColumnMajorTableWidget) -> None:
-        """At bottom-right, wrap to top-left."""
-        rows = table.rowCount()
-        cols = table.columnCount()
-        # Bottom-right -> Top-left
+    def test_navigation_table_wrap_forward(self, table: ColumnMajorTableView) -> None:
+        """At bottom of Measured, wrap to top of Pass/Fail."""
+        rows = table.model().rowCount()
         next_row, next_col = table._get_next_cell(  # noqa: SLF001
-            rows - 1, cols - 1, forward=True
+            rows - 1, MEASURED_COL_INDEX, forward=True
         )
-        assert (next_row, next_col) == (0, 0)
+        assert (next_row, next_col) == (0, PASS_FAIL_COL_INDEX)
 
-    def test_navigation_backward_simple(self, table: ColumnMajorTableWidget) -> None:
+    def test_navigation_off_target_column_forward(
+        self, table: ColumnMajorTableView
+    ) -> None:
+        """From a non-navigable column, Tab should jump to the top of Pass/Fail."""
+        next_row, next_col = table._get_next_cell(  # noqa: SLF001
+            2, 0, forward=True
+        )
+        assert (next_row, next_col) == (0, PASS_FAIL_COL_INDEX)
+
+    def test_navigation_backward_simple(self, table: ColumnMajorTableView) -> None:
         """Shift+Tab should move up within a column."""
-        # (1,0) -> (0,0)
+        # (1,PF) -> (0,PF)
         next_row, next_col = table._get_next_cell(  # noqa: SLF001
-            1, 0, forward=False
+            1, PASS_FAIL_COL_INDEX, forward=False
         )
-        assert (next_row, next_col) == (0, 0)
+        assert (next_row, next_col) == (0, PASS_FAIL_COL_INDEX)
 
-    def test_navigation_skip_header_backward(
-        self, table: ColumnMajorTableWidget
-    ) -> None:
+    def test_navigation_skip_header_backward(self, table: ColumnMajorTableView) -> None:
         """Navigation should skip the header row moving backward."""
         # Row 4 -> Row 2 (Skip 3)
         next_row, next_col = table._get_next_cell(  # noqa: SLF001
-            HEADER_ROW_INDEX + 1, 0, forward=False
+            HEADER_ROW_INDEX + 1, MEASURED_COL_INDEX, forward=False
         )
         assert next_row == HEADER_ROW_INDEX - 1
-        assert next_col == 0
+        assert next_col == MEASURED_COL_INDEX
 
-    def test_navigation_column_wrap_backward(
-        self, table: ColumnMajorTableWidget
-    ) -> None:
-        """At top of column, wrap to bottom of previous column."""
-        rows = table.rowCount()
-        # Top of col 1 -> Bottom of col 0
+    def test_navigation_column_wrap_backward(self, table: ColumnMajorTableView) -> None:
+        """At top of Measured, wrap to bottom of Pass/Fail."""
+        rows = table.model().rowCount()
         next_row, next_col = table._get_next_cell(  # noqa: SLF001
-            0, 1, forward=False
+            0, MEASURED_COL_INDEX, forward=False
         )
         assert next_row == rows - 1
-        assert next_col == 0
+        assert next_col == PASS_FAIL_COL_INDEX
+
+    def test_lookup_matches_computed_navigation(
+        self, table: ColumnMajorTableView
+    ) -> None:
+        """The precomputed move table should agree with _get_next_cell."""
+        for row in range(table.model().rowCount()):
+            for col in range(table.model().columnCount()):
+                for forward in (True, False):
+                    assert table._lookup_next_cell(  # noqa: SLF001
+                        row, col, forward=forward
+                    ) == table._get_next_cell(  # noqa: SLF001
+                        row, col, forward=forward
+                    )
+
+    @pytest.mark.parametrize(
+        ("start", "key", "expected"),
+        [
+            ((1, PASS_FAIL_COL_INDEX), Qt.Key.Key_Tab, (2, PASS_FAIL_COL_INDEX)),
+            (
+                (HEADER_ROW_INDEX - 1, MEASURED_COL_INDEX),
+                Qt.Key.Key_Return,
+                (HEADER_ROW_INDEX + 1, MEASURED_COL_INDEX),
+            ),
+            ((6, PASS_FAIL_COL_INDEX), Qt.Key.Key_Tab, (0, MEASURED_COL_INDEX)),
+            ((0, MEASURED_COL_INDEX), Qt.Key.Key_Backtab, (6, PASS_FAIL_COL_INDEX)),
+        ],
+    )
+    def test_key_press_moves_current_index(
+        self,
+        table: ColumnMajorTableView,
+        start: tuple[int, int],
+        key: Qt.Key,
+        expected: tuple[int, int],
+    ) -> None:
+        """Navigation keys should move the view's current index column-major."""
+        table.setCurrentIndex(table.model().index(*start))
+
+        table.keyPressEvent(
+            QKeyEvent(QEvent.Type.KeyPress, key, Qt.KeyboardModifier.NoModifier)
+        )
+
+        current = table.currentIndex()
+        assert (current.row(), current.column()) == expected
+
+    @pytest.mark.parametrize(
+        ("start", "key", "expected"),
+        [
+            ((1, MEASURED_COL_INDEX), Qt.Key.Key_Tab, (2, MEASURED_COL_INDEX)),
+            ((0, MEASURED_COL_INDEX), Qt.Key.Key_Backtab, (6, PASS_FAIL_COL_INDEX)),
+        ],
+    )
+    def test_editor_key_press_moves_current_index(
+        self,
+        table: ColumnMajorTableView,
+        start: tuple[int, int],
+        key: Qt.Key,
+        expected: tuple[int, int],
+    ) -> None:
+        """Navigation keys typed into an open editor should move column-major."""
+        table.setItemDelegateForColumn(
+            MEASURED_COL_INDEX, MeasuredValueDelegate({}, {}, table)
+        )
+        index = table.model().index(*start)
+        table.setCurrentIndex(index)
+        table.edit(index)
+        editor = table.indexWidget(index)
+        assert editor is not None
+
+        QApplication.sendEvent(
+            editor,
+            QKeyEvent(QEvent.Type.KeyPress, key, Qt.KeyboardModifier.NoModifier),
+        )
+
+        current = table.currentIndex()
+        assert (current.row(), current.column()) == expected
+
+
+class TestTimeSeriesTableModel:
+    """Tests for the time series table model's change reporting."""
+
+    @pytest.fixture
+    def model(self, qapp: QApplication) -> TimeSeriesTableModel:
+        """Create an empty time series model."""
+        _ = qapp
+        return TimeSeriesTableModel()
+
+    def test_update_rows_emits_contiguous_changed_spans(
+        self, model: TimeSeriesTableModel
+    ) -> None:
+        """Only runs of changed oxygen cells should be reported."""
+        spans: list[tuple[int, int]] = []
+        model.dataChanged.connect(
+            lambda first, last, _roles: spans.append((first.column(), last.column()))
+        )
+        rows = [(minute, None) for minute in range(NUM_TIME_SERIES_COLS)]
+        rows[0] = (0, 9.5)
+        rows[1] = (1, 8.25)
+        rows[3] = (3, 7.0)
+
+        model.update_rows(rows)
+
+        assert spans == [(0, 1), (3, 3)]
+        assert model.cell_text(1, 1) == "8.25"
+
+        spans.clear()
+        model.update_rows(rows)
+        assert spans == []
+
+    def test_set_data_emits_cell_edited_for_oxygen_row_only(
+        self, model: TimeSeriesTableModel
+    ) -> None:
+        """User edits of the oxygen row should be announced with their cell."""
+        edited: list[tuple[int, int]] = []
+        model.cell_edited.connect(lambda row, col: edited.append((row, col)))
+
+        assert model.setData(model.index(1, 4), " 5.5 ")
+        assert not model.setData(model.index(0, 4), "99")
+
+        assert edited == [(1, 4)]
+        assert model.cell_text(1, 4) == "5.5"
+        assert model.cell_text(0, 4) == "4"